@@ -5,15 +5,22 @@ A production-ready Python service for automatically scaling LXC containers
 based on workload metrics in Proxmox Virtual Environment.
 """
 
+import importlib
+from typing import Any, List
+
 __version__ = "1.0.0"
 __author__ = "LXC Autoscaler Team"
 __email__ = "support@example.com"
 
-from .core.daemon import AutoscalerDaemon
-from .config.manager import ConfigManager
-from .api.proxmox_client import ProxmoxClient
-from .metrics.collector import MetricsCollector
-from .scaling.engine import ScalingEngine
+# Public classes are imported on first access so that importing the package
+# (e.g. to read __version__) does not pull in aiohttp and YAML.
+_LAZY_IMPORTS = {
+    "AutoscalerDaemon": ".core.daemon",
+    "ConfigManager": ".config.manager",
+    "ProxmoxClient": ".api.proxmox_client",
+    "MetricsCollector": ".metrics.collector",
+    "ScalingEngine": ".scaling.engine",
+}
 
 __all__ = [
     "AutoscalerDaemon",
@@ -21,4 +28,19 @@ __all__ = [
     "ProxmoxClient", 
     "MetricsCollector",
     "ScalingEngine",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public classes lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(__all__))
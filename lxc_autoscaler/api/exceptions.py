@@ -6,17 +6,25 @@ from typing import Any, Dict, Optional
 class ProxmoxAPIError(Exception):
     """Base exception for Proxmox API errors."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response_data: Optional[Dict[str, Any]] = None,
+        retry_after: Optional[float] = None,
+    ):
         """Initialize API error.
         
         Args:
             message: Error message.
             status_code: HTTP status code if available.
             response_data: API response data if available.
+            retry_after: Seconds to wait before retrying, from a Retry-After header.
         """
         super().__init__(message)
         self.status_code = status_code
         self.response_data = response_data or {}
+        self.retry_after = retry_after
 
 
 class ProxmoxConnectionError(ProxmoxAPIError):
@@ -2,10 +2,16 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
-from proxmoxer import ProxmoxAPI
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
 
 from ..config.models import ProxmoxConfig
 from .exceptions import (
@@ -13,6 +19,7 @@ from .exceptions import (
     ProxmoxAuthenticationError,
     ProxmoxConnectionError,
     ProxmoxOperationError,
+    ProxmoxRateLimitError,
     ProxmoxResourceNotFoundError,
     ProxmoxTimeoutError,
 )
@@ -22,7 +29,26 @@ logger = logging.getLogger(__name__)
 
 
 class ProxmoxClient:
-    """Async wrapper for Proxmox VE API operations."""
+    """Async client for the Proxmox VE REST API."""
+    
+    # Node membership changes rarely, but nodes can go offline at any time
+    NODES_CACHE_TTL = 10.0
+    
+    # Proxmox tickets are valid for two hours; renew them a bit earlier
+    TICKET_LIFETIME = 7200.0
+    TICKET_REFRESH_MARGIN = 300.0
+    
+    # HTTP error status -> exception class, anything else is an operation error
+    _STATUS_EXCEPTIONS = {
+        401: ProxmoxAuthenticationError,
+        403: ProxmoxAuthenticationError,
+        404: ProxmoxResourceNotFoundError,
+        408: ProxmoxTimeoutError,
+        429: ProxmoxRateLimitError,
+    }
+    
+    # Gateway and availability errors are safe to retry for any method
+    _RETRYABLE_STATUSES = frozenset({502, 503, 504})
     
     def __init__(self, config: ProxmoxConfig) -> None:
         """Initialize Proxmox client.
@@ -31,9 +57,24 @@ class ProxmoxClient:
             config: Proxmox connection configuration.
         """
         self.config = config
-        self._api: Optional[ProxmoxAPI] = None
+        self._base_url = f"https://{config.host}:{config.port}/api2/json"
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_expiry: Optional[float] = None  # None for non-expiring tokens
+        self._auth_lock = asyncio.Lock()
         self._session: Optional[aiohttp.ClientSession] = None
-        self._semaphore = asyncio.Semaphore(10)  # Limit concurrent requests
+        
+        # Retry policy for transient failures (timeouts, rate limits, 5xx)
+        self.retries = 3
+        self.base_delay = 1.0
+        self.max_delay = 30.0
+        self.jitter = 0.5
+        
+        # Topology caches, expiry stored as time.monotonic() deadlines
+        self._node_cache: Dict[int, Tuple[str, float]] = {}
+        self._nodes_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        
+        # Container endpoint paths keyed by (node, vmid, endpoint)
+        self._lxc_paths: Dict[Tuple[str, int, str], str] = {}
         
     async def __aenter__(self) -> 'ProxmoxClient':
         """Async context manager entry."""
@@ -49,44 +90,8 @@ class ProxmoxClient:
         try:
             logger.info(f"Connecting to Proxmox at {self.config.host}:{self.config.port}")
             
-            # Create HTTP session
-            connector = aiohttp.TCPConnector(
-                verify_ssl=self.config.verify_ssl,
-                limit=20,
-                limit_per_host=10,
-            )
-            
-            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            self._session = aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout,
-            )
-            
-            # Initialize Proxmox API
-            auth_kwargs = {
-                'host': self.config.host,
-                'port': self.config.port,
-                'verify_ssl': self.config.verify_ssl,
-                'timeout': self.config.timeout,
-            }
-            
-            if self.config.token_name and self.config.token_value:
-                # Token-based authentication
-                auth_kwargs.update({
-                    'user': self.config.user,
-                    'token_name': self.config.token_name,
-                    'token_value': self.config.token_value,
-                })
-            elif self.config.password:
-                # Password-based authentication
-                auth_kwargs.update({
-                    'user': self.config.user,
-                    'password': self.config.password,
-                })
-            else:
-                raise ProxmoxAuthenticationError("No authentication method configured")
-            
-            self._api = ProxmoxAPI(**auth_kwargs)
+            self._ensure_session()
+            await self._authenticate()
             
             # Test connection
             await self._test_connection()
@@ -105,58 +110,299 @@ class ProxmoxClient:
         if self._session:
             await self._session.close()
             self._session = None
-        self._api = None
+        self._auth_headers = {}
+        self._auth_expiry = None
         logger.debug("Proxmox API connection closed")
     
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session on first use.
+        
+        The session and its connection pool are kept for the lifetime of the
+        client so that re-authentication does not pay for new TCP and TLS
+        handshakes. Only close() tears them down.
+        
+        Returns:
+            The shared HTTP session.
+        """
+        if self._session is None or self._session.closed:
+            # The connector limit is the only concurrency gate: requests
+            # beyond it wait for a free connection in the pool
+            connector = aiohttp.TCPConnector(
+                ssl=self.config.verify_ssl,
+                limit=self.config.max_concurrent,
+                limit_per_host=self.config.max_concurrent,
+                keepalive_timeout=75,
+                ttl_dns_cache=300,
+            )
+            
+            timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+            )
+        return self._session
+    
+    async def _authenticate(self) -> None:
+        """Build authentication headers for subsequent requests.
+        
+        API tokens are sent as a static ``Authorization`` header. Password
+        authentication requests a ticket and sends it as a cookie together
+        with the CSRF prevention token required for write operations.
+        
+        Raises:
+            ProxmoxAuthenticationError: If no method is configured or login fails.
+        """
+        if self.config.token_name and self.config.token_value:
+            self._auth_headers = {
+                'Authorization': (
+                    f"PVEAPIToken={self.config.user}!"
+                    f"{self.config.token_name}={self.config.token_value}"
+                ),
+            }
+            self._auth_expiry = None
+        elif self.config.password:
+            # Log in without touching the current ticket, so concurrent
+            # requests keep using it until the new one is in place
+            ticket = await self._make_request(
+                'POST',
+                'access/ticket',
+                headers={},
+                username=self.config.user,
+                password=self.config.password,
+            )
+            self._auth_headers = {
+                'Cookie': f"PVEAuthCookie={ticket['ticket']}",
+                'CSRFPreventionToken': ticket['CSRFPreventionToken'],
+            }
+            self._auth_expiry = (
+                time.monotonic() + self.TICKET_LIFETIME - self.TICKET_REFRESH_MARGIN
+            )
+        else:
+            raise ProxmoxAuthenticationError("No authentication method configured")
+    
+    async def _refresh_auth_if_needed(self) -> None:
+        """Renew the authentication ticket shortly before it expires."""
+        if self._auth_expiry is None or time.monotonic() < self._auth_expiry:
+            return
+        
+        async with self._auth_lock:
+            # Another request may have renewed the ticket while we waited
+            if self._auth_expiry is not None and time.monotonic() >= self._auth_expiry:
+                logger.debug("Refreshing Proxmox authentication ticket")
+                await self._authenticate()
+    
     async def _test_connection(self) -> None:
         """Test API connection by retrieving version."""
         try:
-            await self._make_request(self._api.version.get)
+            await self._make_request('GET', 'version')
         except Exception as e:
             raise ProxmoxConnectionError(f"Connection test failed: {e}")
     
-    async def _make_request(self, request_func, *args, **kwargs) -> Any:
-        """Make async API request with error handling and rate limiting.
+    @staticmethod
+    def _encode_params(params: Dict[str, Any]) -> Dict[str, str]:
+        """Encode request parameters the way the Proxmox API expects them.
+        
+        Args:
+            params: Request parameters.
+            
+        Returns:
+            Parameters with booleans as 0/1 and all values as strings.
+        """
+        return {
+            key: str(int(value)) if isinstance(value, bool) else str(value)
+            for key, value in params.items()
+            if value is not None
+        }
+    
+    async def _make_request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        **params,
+    ) -> Any:
+        """Make async API request, retrying transient failures.
+        
+        Timeouts, rate limits and gateway errors are retried up to
+        ``self.retries`` times with capped exponential backoff and jitter.
+        A Retry-After header on the response takes precedence over the
+        computed delay. A plain 500 is only retried for GET requests, since
+        a write may already have been applied. Other errors are raised
+        immediately.
         
         Args:
-            request_func: Proxmox API function to call.
-            *args: Positional arguments for the request.
-            **kwargs: Keyword arguments for the request.
+            method: HTTP method.
+            path: API path relative to ``/api2/json``.
+            headers: Headers to send instead of the authentication headers.
+                The ticket is not refreshed for such requests.
+            **params: Query parameters for GET/DELETE, form data otherwise.
             
         Returns:
-            API response data.
+            The ``data`` member of the API response.
             
         Raises:
             ProxmoxAPIError: If request fails.
         """
-        if not self._api:
-            raise ProxmoxConnectionError("Not connected to Proxmox API")
-        
-        async with self._semaphore:
+        attempt = 0
+        while True:
             try:
-                # Execute request in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None, 
-                    lambda: request_func(*args, **kwargs)
+                return await self._send_request(method, path, params, headers)
+            except ProxmoxAPIError as e:
+                if attempt >= self.retries or not self._is_transient(e, method):
+                    raise
+                delay = self._retry_delay(attempt, e.retry_after)
+                logger.warning(
+                    f"{method} {path} failed ({e}), retrying in {delay:.1f}s "
+                    f"({attempt + 1}/{self.retries})"
                 )
-                return response
-                
-            except Exception as e:
-                error_msg = str(e).lower()
+                await asyncio.sleep(delay)
+                attempt += 1
+    
+    @classmethod
+    def _is_transient(cls, error: ProxmoxAPIError, method: str) -> bool:
+        """Check whether a failed request is worth retrying.
+        
+        Args:
+            error: Error raised by the request.
+            method: HTTP method of the request.
+            
+        Returns:
+            True for timeouts, rate limits and 502/503/504 responses, and
+            for 500 responses to GET requests.
+        """
+        if isinstance(error, (ProxmoxTimeoutError, ProxmoxRateLimitError)):
+            return True
+        if error.status_code in cls._RETRYABLE_STATUSES:
+            return True
+        return error.status_code == 500 and method == 'GET'
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute how long to wait before the next attempt.
+        
+        Args:
+            attempt: Zero-based number of the attempt that failed.
+            retry_after: Server-requested delay, if any.
+            
+        Returns:
+            Delay in seconds, never more than ``self.max_delay``.
+        """
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return min(self.max_delay, delay * (1 + random.random() * self.jitter))
+    
+    async def _send_request(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a single API request.
+        
+        Args:
+            method: HTTP method.
+            path: API path relative to ``/api2/json``.
+            params: Query parameters for GET/DELETE, form data otherwise.
+            headers: Headers to send instead of the authentication headers.
+            
+        Returns:
+            The ``data`` member of the API response.
+            
+        Raises:
+            ProxmoxAPIError: If request fails.
+        """
+        if not self._session:
+            raise ProxmoxConnectionError("Not connected to Proxmox API")
+        
+        if headers is None:
+            await self._refresh_auth_if_needed()
+            headers = self._auth_headers
+        
+        url = f"{self._base_url}/{path}"
+        encoded = self._encode_params(params)
+        if method in ('GET', 'DELETE'):
+            request_kwargs = {'params': encoded}
+        else:
+            request_kwargs = {'data': encoded}
+        
+        try:
+            async with self._session.request(
+                method, url, headers=headers, **request_kwargs
+            ) as resp:
+                if resp.status >= 400:
+                    await self._raise_for_status(resp)
+                payload = await resp.json(loads=_json_loads, content_type=None)
                 
-                if "authentication" in error_msg or "unauthorized" in error_msg:
-                    raise ProxmoxAuthenticationError(f"Authentication failed: {e}")
-                elif "not found" in error_msg or "does not exist" in error_msg:
-                    raise ProxmoxResourceNotFoundError(f"Resource not found: {e}")
-                elif "timeout" in error_msg:
-                    raise ProxmoxTimeoutError(f"Request timeout: {e}")
-                elif "rate limit" in error_msg:
-                    # Implement exponential backoff
-                    await asyncio.sleep(1)
-                    raise ProxmoxAPIError(f"Rate limit exceeded: {e}")
-                else:
-                    raise ProxmoxOperationError(f"API request failed: {e}")
+        except ProxmoxAPIError:
+            raise
+        except asyncio.TimeoutError as e:
+            raise ProxmoxTimeoutError(f"Request timeout: {method} {path}: {e}")
+        except aiohttp.ClientError as e:
+            raise ProxmoxConnectionError(f"API request failed: {method} {path}: {e}")
+        
+        if isinstance(payload, dict):
+            return payload.get('data')
+        return payload
+    
+    async def _raise_for_status(self, resp: aiohttp.ClientResponse) -> None:
+        """Raise the exception matching an error response.
+        
+        Args:
+            resp: Response with an HTTP error status.
+            
+        Raises:
+            ProxmoxAPIError: Always, subclass chosen by status code.
+        """
+        try:
+            response_data = await resp.json(loads=_json_loads, content_type=None)
+        except (ValueError, aiohttp.ClientError):
+            response_data = None
+        if not isinstance(response_data, dict):
+            response_data = None
+        
+        status = resp.status
+        exc_class = self._STATUS_EXCEPTIONS.get(status, ProxmoxOperationError)
+        raise exc_class(
+            f"API request failed: {status} {resp.reason}",
+            status,
+            response_data,
+            self._parse_retry_after(resp.headers.get('Retry-After')),
+        )
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parse a Retry-After header given in seconds.
+        
+        Args:
+            value: Header value.
+            
+        Returns:
+            Delay in seconds, or None if absent or not numeric.
+        """
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+    
+    def _lxc_path(self, node: str, vmid: int, endpoint: str) -> str:
+        """Get the API path of a container endpoint.
+        
+        Args:
+            node: Proxmox node name.
+            vmid: Container VMID.
+            endpoint: Endpoint below the container, e.g. ``status/current``.
+            
+        Returns:
+            Path relative to ``/api2/json``.
+        """
+        key = (node, vmid, endpoint)
+        path = self._lxc_paths.get(key)
+        if path is None:
+            path = self._lxc_paths[key] = f"nodes/{node}/lxc/{vmid}/{endpoint}"
+        return path
     
     async def get_container_status(self, node: str, vmid: int) -> Dict[str, Any]:
         """Get LXC container status.
@@ -168,10 +414,15 @@ class ProxmoxClient:
         Returns:
             Container status information.
         """
-        logger.debug(f"Getting status for container {vmid} on node {node}")
-        return await self._make_request(
-            self._api.nodes(node).lxc(vmid).status.current.get
-        )
+        logger.debug("Getting status for container %s on node %s", vmid, node)
+        try:
+            return await self._make_request(
+                'GET', self._lxc_path(node, vmid, 'status/current')
+            )
+        except ProxmoxResourceNotFoundError:
+            # Container moved or was removed, resolve its node again next time
+            self.invalidate_cache(vmid)
+            raise
     
     async def get_container_config(self, node: str, vmid: int) -> Dict[str, Any]:
         """Get LXC container configuration.
@@ -183,10 +434,8 @@ class ProxmoxClient:
         Returns:
             Container configuration.
         """
-        logger.debug(f"Getting config for container {vmid} on node {node}")
-        return await self._make_request(
-            self._api.nodes(node).lxc(vmid).config.get
-        )
+        logger.debug("Getting config for container %s on node %s", vmid, node)
+        return await self._make_request('GET', self._lxc_path(node, vmid, 'config'))
     
     async def get_container_rrd_data(
         self, 
@@ -206,9 +455,10 @@ class ProxmoxClient:
         Returns:
             RRD data points.
         """
-        logger.debug(f"Getting RRD data for container {vmid} on node {node}")
+        logger.debug("Getting RRD data for container %s on node %s", vmid, node)
         return await self._make_request(
-            self._api.nodes(node).lxc(vmid).rrddata.get,
+            'GET',
+            self._lxc_path(node, vmid, 'rrddata'),
             timeframe=timeframe,
             cf=cf
         )
@@ -229,9 +479,12 @@ class ProxmoxClient:
         Returns:
             Update operation result.
         """
-        logger.info(f"Updating config for container {vmid} on node {node}: {config_params}")
+        logger.info(
+            "Updating config for container %s on node %s: %s", vmid, node, config_params
+        )
         return await self._make_request(
-            self._api.nodes(node).lxc(vmid).config.put,
+            'PUT',
+            self._lxc_path(node, vmid, 'config'),
             **config_params
         )
     
@@ -264,7 +517,9 @@ class ProxmoxClient:
         if not config_updates:
             raise ValueError("At least one resource parameter must be specified")
         
-        logger.info(f"Resizing container {vmid} on node {node}: {config_updates}")
+        logger.info(
+            "Resizing container %s on node %s: %s", vmid, node, config_updates
+        )
         return await self.update_container_config(node, vmid, **config_updates)
     
     async def get_node_status(self, node: str) -> Dict[str, Any]:
@@ -276,10 +531,8 @@ class ProxmoxClient:
         Returns:
             Node status information.
         """
-        logger.debug(f"Getting status for node {node}")
-        return await self._make_request(
-            self._api.nodes(node).status.get
-        )
+        logger.debug("Getting status for node %s", node)
+        return await self._make_request('GET', f"nodes/{node}/status")
     
     async def list_containers(self, node: str) -> List[Dict[str, Any]]:
         """List all LXC containers on a node.
@@ -290,10 +543,8 @@ class ProxmoxClient:
         Returns:
             List of containers.
         """
-        logger.debug(f"Listing containers on node {node}")
-        containers = await self._make_request(
-            self._api.nodes(node).lxc.get
-        )
+        logger.debug("Listing containers on node %s", node)
+        containers = await self._make_request('GET', f"nodes/{node}/lxc")
         # Filter only LXC containers
         return [c for c in containers if c.get('type') == 'lxc']
     
@@ -303,8 +554,14 @@ class ProxmoxClient:
         Returns:
             List of nodes.
         """
+        now = time.monotonic()
+        if self._nodes_cache and self._nodes_cache[0] > now:
+            return self._nodes_cache[1]
+        
         logger.debug("Listing Proxmox nodes")
-        return await self._make_request(self._api.nodes.get)
+        nodes = await self._make_request('GET', 'nodes')
+        self._nodes_cache = (now + self.NODES_CACHE_TTL, nodes)
+        return nodes
     
     async def find_container_node(self, vmid: int) -> Optional[str]:
         """Find which node contains the specified container.
@@ -315,17 +572,62 @@ class ProxmoxClient:
         Returns:
             Node name if found, None otherwise.
         """
+        cached = self._node_cache.get(vmid)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
+        node = await self._resolve_container_node(vmid)
+        if node is not None:
+            self._node_cache[vmid] = (node, time.monotonic() + self.config.cache_ttl)
+        return node
+    
+    def invalidate_cache(self, vmid: Optional[int] = None) -> None:
+        """Drop cached topology information.
+        
+        Args:
+            vmid: Container whose node lookup should be forgotten. If None,
+                all cached lookups and the node list are dropped.
+        """
+        if vmid is None:
+            self._node_cache.clear()
+            self._nodes_cache = None
+        else:
+            self._node_cache.pop(vmid, None)
+    
+    async def _resolve_container_node(self, vmid: int) -> Optional[str]:
+        """Look up the node hosting a container via the API.
+        
+        Args:
+            vmid: Container VMID.
+            
+        Returns:
+            Node name if found, None otherwise.
+        """
+        # The cluster endpoint already aggregates guests across all nodes
+        try:
+            resources = await self.get_cluster_resources()
+        except ProxmoxAPIError as e:
+            logger.debug("Cluster resources unavailable, scanning nodes: %s", e)
+        else:
+            for resource in resources:
+                if resource.get('type') == 'lxc' and resource.get('vmid') == vmid:
+                    return resource.get('node')
+            return None
+        
         nodes = await self.list_nodes()
+        results = await asyncio.gather(
+            *(self.list_containers(node_info['node']) for node_info in nodes),
+            return_exceptions=True,
+        )
         
-        for node_info in nodes:
-            node_name = node_info['node']
-            try:
-                containers = await self.list_containers(node_name)
-                for container in containers:
-                    if container.get('vmid') == vmid:
-                        return node_name
-            except ProxmoxResourceNotFoundError:
+        for node_info, containers in zip(nodes, results):
+            if isinstance(containers, ProxmoxResourceNotFoundError):
                 continue
+            if isinstance(containers, BaseException):
+                raise containers
+            for container in containers:
+                if container.get('vmid') == vmid:
+                    return node_info['node']
         
         return None
     
@@ -336,7 +638,31 @@ class ProxmoxClient:
             Cluster resource data.
         """
         logger.debug("Getting cluster resources")
-        return await self._make_request(self._api.cluster.resources.get)
+        return await self._make_request('GET', 'cluster/resources')
+    
+    async def get_cluster_vm_resources(self) -> Dict[int, Dict[str, Any]]:
+        """Get status of every guest in the cluster with a single request.
+        
+        Entries carry the node, status, uptime and current usage of each
+        container and VM. Container node lookups are refreshed from the
+        result as a side effect.
+        
+        Returns:
+            Guest resource data indexed by VMID.
+        """
+        logger.debug("Getting cluster VM resources")
+        resources = await self._make_request('GET', 'cluster/resources', type='vm')
+        
+        expiry = time.monotonic() + self.config.cache_ttl
+        by_vmid: Dict[int, Dict[str, Any]] = {}
+        for resource in resources:
+            if 'vmid' not in resource:
+                continue
+            vmid = int(resource['vmid'])
+            by_vmid[vmid] = resource
+            if resource.get('type') == 'lxc' and resource.get('node'):
+                self._node_cache[vmid] = (resource['node'], expiry)
+        return by_vmid
     
     async def health_check(self) -> bool:
         """Perform health check on API connection.
@@ -345,8 +671,15 @@ class ProxmoxClient:
             True if connection is healthy.
         """
         try:
-            await self._make_request(self._api.version.get)
+            await self._make_request('GET', 'version')
             return True
+        except ProxmoxAuthenticationError as e:
+            logger.warning(f"Health check failed, re-authenticating: {e}")
+            try:
+                await self._authenticate()
+            except Exception as auth_error:
+                logger.warning(f"Re-authentication failed: {auth_error}")
+            return False
         except Exception as e:
             logger.warning(f"Health check failed: {e}")
             return False
\ No newline at end of file
@@ -1,25 +1,54 @@
 """Configuration manager for loading and validating YAML configurations."""
 
+import hashlib
 import logging
 import os
+import re
+import stat
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
-from .models import (
-    AutoscalerConfig,
-    ContainerConfig,
-    GlobalConfig,
-    ProxmoxConfig,
-    ResourceLimits,
-    SafetyConfig,
-    ScalingThresholds,
-)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+from .models import AutoscalerConfig
 
 
 logger = logging.getLogger(__name__)
 
+# ${VAR} or ${VAR:default}, anywhere inside a string
+_ENV_RE = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+
+
+def _env_replacement(match: re.Match) -> str:
+    """Return the environment value for an embedded ${VAR[:default]} reference."""
+    return os.environ.get(match.group(1), match.group(2) or '')
+
+
+def _substitute_env_string(value: str) -> Optional[str]:
+    """Substitute environment variable references in a string.
+    
+    A value consisting solely of an unset variable without a default
+    becomes None, so optional settings can be left undefined.
+    
+    Args:
+        value: String that may contain ${VAR} or ${VAR:default} references.
+        
+    Returns:
+        String with references replaced, or the original string if it
+        contains none.
+    """
+    if '${' not in value:
+        return value
+    match = _ENV_RE.fullmatch(value)
+    if match:
+        return os.environ.get(match.group(1), match.group(2))
+    return _ENV_RE.sub(_env_replacement, value)
+
 
 class ConfigurationError(Exception):
     """Configuration validation or loading error."""
@@ -49,6 +78,10 @@ class ConfigManager:
         """
         self.config_path = self._find_config_file(config_path)
         self._config: Optional[AutoscalerConfig] = None
+        # (path, st_mtime_ns) and content fingerprint of the file
+        # self._config was loaded from
+        self._loaded_key: Optional[Tuple[Path, int]] = None
+        self._loaded_fingerprint: Optional[str] = None
         
     def _find_config_file(self, config_path: Optional[str] = None) -> Path:
         """Find configuration file path.
@@ -76,9 +109,11 @@ class ConfigManager:
         for path_str in paths_to_check:
             try:
                 path = Path(path_str).resolve()
-                if path.exists() and path.is_file():
+                if stat.S_ISREG(os.stat(path).st_mode):
                     logger.info(f"Found configuration file: {path}")
                     return path
+            except FileNotFoundError:
+                continue
             except (OSError, ValueError) as e:
                 # Skip invalid paths (e.g., unresolved environment variables)
                 logger.debug(f"Skipping invalid path '{path_str}': {e}")
@@ -121,8 +156,12 @@ class ConfigManager:
         try:
             logger.info(f"Loading configuration from {self.config_path}")
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f)
+            config_path = self.config_path
+            with open(config_path, 'rb') as f:
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+                raw = f.read()
+            
+            config_data = yaml.load(raw, Loader=_YamlLoader)
             
             if not isinstance(config_data, dict):
                 raise ConfigurationError("Configuration file must contain a YAML object")
@@ -132,6 +171,8 @@ class ConfigManager:
             
             # Parse and validate configuration
             self._config = self._parse_config(config_data)
+            self._loaded_key = (config_path, mtime_ns)
+            self._loaded_fingerprint = self._fingerprint(raw)
             
             logger.info("Configuration loaded successfully")
             return self._config
@@ -143,30 +184,55 @@ class ConfigManager:
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {e}")
     
+    @staticmethod
+    def _fingerprint(raw: bytes) -> str:
+        """Fingerprint configuration file contents for change detection on reload.
+        
+        Values of environment variables referenced by the file are included,
+        since they are substituted into the parsed configuration.
+        
+        Args:
+            raw: Configuration file contents.
+            
+        Returns:
+            Hex SHA-256 digest.
+        """
+        digest = hashlib.sha256(raw)
+        names = {m.group(1) for m in _ENV_RE.finditer(raw.decode('utf-8', 'replace'))}
+        for name in sorted(names):
+            value = os.environ.get(name)
+            digest.update(f"\0{name}={value!r}".encode('utf-8', 'surrogateescape'))
+        return digest.hexdigest()
+    
     def _substitute_environment_variables(self, data: Any) -> Any:
-        """Recursively substitute environment variables in configuration data.
+        """Substitute environment variables in configuration data.
+        
+        Every string in the structure has ${VAR} and ${VAR:default}
+        references replaced, including references embedded in longer
+        strings. Nested containers are walked with an explicit stack and
+        updated in place, so configurations without references are
+        returned as-is without copying.
         
         Args:
-            data: Configuration data structure.
+            data: Configuration data structure, typically freshly parsed YAML.
             
         Returns:
             Configuration data with environment variables substituted.
         """
-        if isinstance(data, dict):
-            return {key: self._substitute_environment_variables(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [self._substitute_environment_variables(item) for item in data]
-        elif isinstance(data, str) and data.startswith('${') and data.endswith('}'):
-            env_var = data[2:-1]
-            default_value = None
-            
-            # Handle ${VAR:default} syntax
-            if ':' in env_var:
-                env_var, default_value = env_var.split(':', 1)
-            
-            return os.getenv(env_var, default_value)
-        else:
-            return data
+        if isinstance(data, str):
+            return _substitute_env_string(data)
+        
+        stack = [data] if isinstance(data, (dict, list)) else []
+        while stack:
+            container = stack.pop()
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in items:
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif isinstance(value, str) and '${' in value:
+                    container[key] = _substitute_env_string(value)
+        
+        return data
     
     def _parse_config(self, config_data: Dict[str, Any]) -> AutoscalerConfig:
         """Parse configuration dictionary into typed objects.
@@ -181,122 +247,41 @@ class ConfigManager:
             ConfigurationError: If configuration is invalid.
         """
         try:
-            # Parse Proxmox configuration
-            proxmox_data = config_data.get('proxmox', {})
-            if not proxmox_data:
-                raise ConfigurationError("Proxmox configuration is required")
-            
-            proxmox_config = ProxmoxConfig(**proxmox_data)
-            
-            # Parse global configuration
-            global_data = config_data.get('global', {})
-            global_config = GlobalConfig(**global_data)
-            
-            # Parse safety configuration
-            safety_data = config_data.get('safety', {})
-            safety_config = SafetyConfig(**safety_data)
-            
-            # Parse default thresholds
-            thresholds_data = config_data.get('default_thresholds', {})
-            default_thresholds = ScalingThresholds(**thresholds_data)
-            
-            # Parse default limits
-            limits_data = config_data.get('default_limits', {})
-            default_limits = ResourceLimits(**limits_data)
-            
-            # Parse container configurations
-            containers = []
-            containers_data = config_data.get('containers', [])
-            
-            for container_data in containers_data:
-                container_config = self._parse_container_config(
-                    container_data, 
-                    default_thresholds, 
-                    default_limits
-                )
-                containers.append(container_config)
-            
-            return AutoscalerConfig(
-                proxmox=proxmox_config,
-                global_config=global_config,
-                safety=safety_config,
-                default_thresholds=default_thresholds,
-                default_limits=default_limits,
-                containers=containers,
-            )
-            
+            return AutoscalerConfig.from_dict(config_data)
         except TypeError as e:
             raise ConfigurationError(f"Invalid configuration parameter: {e}")
         except ValueError as e:
             raise ConfigurationError(f"Invalid configuration value: {e}")
     
-    def _parse_container_config(
-        self, 
-        container_data: Dict[str, Any],
-        default_thresholds: ScalingThresholds,
-        default_limits: ResourceLimits,
-    ) -> ContainerConfig:
-        """Parse container configuration with defaults.
-        
-        Args:
-            container_data: Container configuration dictionary.
-            default_thresholds: Default scaling thresholds.
-            default_limits: Default resource limits.
-            
-        Returns:
-            Container configuration object.
-        """
-        if 'vmid' not in container_data:
-            raise ConfigurationError("Container configuration must include 'vmid'")
-        
-        # Parse custom thresholds if provided
-        thresholds = None
-        if 'thresholds' in container_data:
-            thresholds_data = container_data['thresholds']
-            # Merge with defaults
-            merged_thresholds = {
-                'cpu_scale_up': default_thresholds.cpu_scale_up,
-                'cpu_scale_down': default_thresholds.cpu_scale_down,
-                'memory_scale_up': default_thresholds.memory_scale_up,
-                'memory_scale_down': default_thresholds.memory_scale_down,
-                **thresholds_data
-            }
-            thresholds = ScalingThresholds(**merged_thresholds)
-        
-        # Parse custom limits if provided
-        limits = None
-        if 'limits' in container_data:
-            limits_data = container_data['limits']
-            # Merge with defaults
-            merged_limits = {
-                'min_cpu_cores': default_limits.min_cpu_cores,
-                'max_cpu_cores': default_limits.max_cpu_cores,
-                'min_memory_mb': default_limits.min_memory_mb,
-                'max_memory_mb': default_limits.max_memory_mb,
-                'cpu_step': default_limits.cpu_step,
-                'memory_step_mb': default_limits.memory_step_mb,
-                **limits_data
-            }
-            limits = ResourceLimits(**merged_limits)
-        
-        # Create container configuration
-        container_config = ContainerConfig(
-            vmid=container_data['vmid'],
-            enabled=container_data.get('enabled', True),
-            thresholds=thresholds,
-            limits=limits,
-            cooldown_seconds=container_data.get('cooldown_seconds', 300),
-            evaluation_periods=container_data.get('evaluation_periods', 3),
-        )
-        
-        return container_config
-    
     def reload_config(self) -> AutoscalerConfig:
         """Reload configuration from file.
         
+        If the file has not been modified since it was last loaded, or was
+        only touched without changing its contents, the current configuration
+        object is returned without re-parsing it.
+        
         Returns:
             Reloaded configuration object.
         """
+        if self._config is not None and self._loaded_key is not None:
+            try:
+                mtime_ns = os.stat(self.config_path).st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if self._loaded_key == (self.config_path, mtime_ns):
+                logger.info("Configuration file unchanged, keeping current configuration")
+                return self._config
+            
+            if mtime_ns is not None and self._loaded_key[0] == self.config_path:
+                try:
+                    raw = self.config_path.read_bytes()
+                except OSError:
+                    raw = None
+                if raw is not None and self._fingerprint(raw) == self._loaded_fingerprint:
+                    self._loaded_key = (self.config_path, mtime_ns)
+                    logger.info("Configuration contents unchanged, keeping current configuration")
+                    return self._config
+        
         logger.info("Reloading configuration")
         return self.load_config()
     
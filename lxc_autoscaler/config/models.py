@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Final, List, Optional, Tuple, Union
 
 
-@dataclass
+# Configuration is immutable once validated; slots need Python 3.10+
+_CONFIG_DATACLASS = {'frozen': True}
+if sys.version_info >= (3, 10):
+    _CONFIG_DATACLASS['slots'] = True
+
+_VALID_LOG_LEVELS: Final = frozenset(("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+
+
+@dataclass(**_CONFIG_DATACLASS)
 class ProxmoxConfig:
     """Proxmox VE connection configuration."""
     
@@ -20,14 +29,20 @@ class ProxmoxConfig:
     token_value: Optional[str] = None
     verify_ssl: bool = True
     timeout: int = 30
+    cache_ttl: int = 60
+    max_concurrent: int = 10
     
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
         if not self.password and not (self.token_name and self.token_value):
             raise ValueError("Either password or token authentication must be provided")
+        if self.cache_ttl < 0:
+            raise ValueError("Cache TTL must not be negative")
+        if self.max_concurrent < 1:
+            raise ValueError("Max concurrent requests must be at least 1")
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class ScalingThresholds:
     """Resource scaling thresholds."""
     
@@ -35,6 +50,11 @@ class ScalingThresholds:
     cpu_scale_down: float = 30.0
     memory_scale_up: float = 85.0
     memory_scale_down: float = 40.0
+    # (cpu_scale_up, cpu_scale_down, memory_scale_up, memory_scale_down),
+    # for unpacking once per evaluation in the scaling hot path
+    as_tuple: Tuple[float, float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Validate threshold values."""
@@ -50,9 +70,13 @@ class ScalingThresholds:
             raise ValueError("CPU scale up threshold must be greater than scale down threshold")
         if self.memory_scale_up <= self.memory_scale_down:
             raise ValueError("Memory scale up threshold must be greater than scale down threshold")
+        object.__setattr__(self, 'as_tuple', (
+            self.cpu_scale_up, self.cpu_scale_down,
+            self.memory_scale_up, self.memory_scale_down,
+        ))
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class ResourceLimits:
     """Resource scaling limits."""
     
@@ -62,6 +86,11 @@ class ResourceLimits:
     max_memory_mb: int = 8192
     cpu_step: int = 1
     memory_step_mb: int = 256
+    # (min_cpu_cores, max_cpu_cores, min_memory_mb, max_memory_mb, cpu_step,
+    # memory_step_mb), for unpacking once per evaluation
+    as_tuple: Tuple[int, int, int, int, int, int] = field(
+        init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Validate resource limits."""
@@ -73,9 +102,14 @@ class ResourceLimits:
             raise ValueError("CPU step must be positive")
         if self.memory_step_mb <= 0:
             raise ValueError("Memory step must be positive")
+        object.__setattr__(self, 'as_tuple', (
+            self.min_cpu_cores, self.max_cpu_cores,
+            self.min_memory_mb, self.max_memory_mb,
+            self.cpu_step, self.memory_step_mb,
+        ))
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class ContainerConfig:
     """Per-container scaling configuration."""
     
@@ -88,17 +122,17 @@ class ContainerConfig:
     
     def __post_init__(self) -> None:
         """Set defaults if not provided."""
-        if self.thresholds is None:
-            self.thresholds = ScalingThresholds()
-        if self.limits is None:
-            self.limits = ResourceLimits()
         if self.cooldown_seconds < 60:
             raise ValueError("Cooldown period must be at least 60 seconds")
         if self.evaluation_periods < 1:
             raise ValueError("Evaluation periods must be at least 1")
+        if self.thresholds is None:
+            object.__setattr__(self, 'thresholds', ScalingThresholds())
+        if self.limits is None:
+            object.__setattr__(self, 'limits', ResourceLimits())
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class GlobalConfig:
     """Global autoscaler configuration."""
     
@@ -112,14 +146,13 @@ class GlobalConfig:
     
     def __post_init__(self) -> None:
         """Validate global configuration."""
-        valid_log_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if self.log_level not in valid_log_levels:
-            raise ValueError(f"Log level must be one of {valid_log_levels}")
+        if self.log_level not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {sorted(_VALID_LOG_LEVELS)}")
         if self.monitoring_interval < 30:
             raise ValueError("Monitoring interval must be at least 30 seconds")
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class SafetyConfig:
     """Safety and resource protection configuration."""
     
@@ -140,7 +173,7 @@ class SafetyConfig:
             raise ValueError("Max memory usage threshold must be between 50 and 100")
 
 
-@dataclass
+@dataclass(**_CONFIG_DATACLASS)
 class AutoscalerConfig:
     """Main autoscaler configuration."""
     
@@ -150,28 +183,143 @@ class AutoscalerConfig:
     default_thresholds: ScalingThresholds = field(default_factory=ScalingThresholds)
     default_limits: ResourceLimits = field(default_factory=ResourceLimits)
     containers: List[ContainerConfig] = field(default_factory=list)
+    # Lookup index over containers; the list keeps configuration order
+    containers_by_vmid: Dict[int, ContainerConfig] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Position in containers of each indexed container
+    _container_positions: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Containers to monitor and scale, in configuration order
+    enabled_containers: Tuple[ContainerConfig, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        """Index containers by VMID and collect the enabled ones."""
+        for idx, container in enumerate(self.containers):
+            if container.vmid not in self.containers_by_vmid:
+                self.containers_by_vmid[container.vmid] = container
+                self._container_positions[container.vmid] = idx
+        self._update_enabled_containers()
+    
+    def _update_enabled_containers(self) -> None:
+        """Recompute enabled_containers after containers changed."""
+        object.__setattr__(self, 'enabled_containers', tuple(
+            container for container in self.containers if container.enabled
+        ))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> AutoscalerConfig:
+        """Build a validated configuration from a raw configuration mapping.
+        
+        Container thresholds and limits are merged over the defaults; a
+        container without overrides shares the default instances.
+        
+        Args:
+            data: Configuration dictionary as loaded from YAML.
+            
+        Returns:
+            Validated configuration object.
+            
+        Raises:
+            TypeError: If a section contains an unknown parameter.
+            ValueError: If a value fails validation.
+        """
+        proxmox_data = data.get('proxmox')
+        if not proxmox_data:
+            raise ValueError("Proxmox configuration is required")
+        
+        default_thresholds = ScalingThresholds(**data.get('default_thresholds', {}))
+        default_limits = ResourceLimits(**data.get('default_limits', {}))
+        
+        containers = []
+        for container_data in data.get('containers', []):
+            if 'vmid' not in container_data:
+                raise ValueError("Container configuration must include 'vmid'")
+            
+            thresholds_data = container_data.get('thresholds')
+            limits_data = container_data.get('limits')
+            containers.append(ContainerConfig(
+                vmid=container_data['vmid'],
+                enabled=container_data.get('enabled', True),
+                thresholds=(
+                    replace(default_thresholds, **thresholds_data)
+                    if thresholds_data else default_thresholds
+                ),
+                limits=(
+                    replace(default_limits, **limits_data)
+                    if limits_data else default_limits
+                ),
+                cooldown_seconds=container_data.get('cooldown_seconds', 300),
+                evaluation_periods=container_data.get('evaluation_periods', 3),
+            ))
+        
+        return cls(
+            proxmox=ProxmoxConfig(**proxmox_data),
+            global_config=GlobalConfig(**data.get('global', {})),
+            safety=SafetyConfig(**data.get('safety', {})),
+            default_thresholds=default_thresholds,
+            default_limits=default_limits,
+            containers=containers,
+        )
     
     def get_container_config(self, vmid: int) -> Optional[ContainerConfig]:
         """Get configuration for specific container."""
-        for container in self.containers:
-            if container.vmid == vmid:
-                return container
-        return None
+        return self.containers_by_vmid.get(vmid)
     
     def add_container(self, container: ContainerConfig) -> None:
         """Add or update container configuration."""
-        existing = self.get_container_config(container.vmid)
-        if existing:
-            # Update existing configuration
-            idx = self.containers.index(existing)
+        idx = self._container_positions.get(container.vmid)
+        if idx is not None:
+            # Update existing configuration in place
             self.containers[idx] = container
         else:
+            self._container_positions[container.vmid] = len(self.containers)
             self.containers.append(container)
+        self.containers_by_vmid[container.vmid] = container
+        self._update_enabled_containers()
     
     def remove_container(self, vmid: int) -> bool:
         """Remove container from configuration."""
-        container = self.get_container_config(vmid)
-        if container:
-            self.containers.remove(container)
-            return True
-        return False
\ No newline at end of file
+        if self.containers_by_vmid.pop(vmid, None) is None:
+            return False
+        idx = self._container_positions.pop(vmid)
+        del self.containers[idx]
+        # Containers after the removed one move up by one
+        for pos in range(idx, len(self.containers)):
+            container = self.containers[pos]
+            if container.vmid == vmid and vmid not in self.containers_by_vmid:
+                # A later duplicate is now the first entry for this VMID
+                self.containers_by_vmid[vmid] = container
+                self._container_positions[vmid] = pos
+            elif self._container_positions.get(container.vmid) == pos + 1:
+                self._container_positions[container.vmid] = pos
+        self._update_enabled_containers()
+        return True
+
+
+def diff_containers(
+    old: Dict[int, ContainerConfig],
+    new: Dict[int, ContainerConfig],
+) -> Tuple[List[ContainerConfig], List[int], List[ContainerConfig]]:
+    """Compare two container indexes, e.g. before and after a reload.
+    
+    Args:
+        old: Previous containers by VMID.
+        new: New containers by VMID.
+        
+    Returns:
+        Tuple of (added containers, removed VMIDs, updated containers).
+    """
+    added = []
+    updated = []
+    for vmid, container in new.items():
+        previous = old.get(vmid)
+        if previous is None:
+            added.append(container)
+        elif previous is not container and previous != container:
+            updated.append(container)
+    removed = [vmid for vmid in old if vmid not in new]
+    return added, removed, updated
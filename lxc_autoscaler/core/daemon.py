@@ -6,14 +6,15 @@ import os
 import signal
 import sys
 import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Optional, Set
 
 from ..api.exceptions import ProxmoxAPIError
 from ..api.proxmox_client import ProxmoxClient
 from ..config.manager import ConfigManager, ConfigurationError
-from ..config.models import AutoscalerConfig
-from ..logging.setup import setup_logging, get_logger, log_exception, with_log_context
+from ..config.models import AutoscalerConfig, diff_containers
+from ..logging.setup import setup_logging, get_logger, log_exception
 from ..metrics.collector import MetricsCollector, MetricsCollectionError
 from ..scaling.engine import ScalingEngine, ScalingEngineError
 
@@ -26,18 +27,36 @@ class DaemonError(Exception):
     pass
 
 
+class _CycleLogFilter(logging.Filter):
+    """Tag log records with the daemon's current scaling cycle number."""
+    
+    def __init__(self, daemon: 'AutoscalerDaemon') -> None:
+        super().__init__()
+        self.daemon = daemon
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.cycle = self.daemon._cycle_no
+        return True
+
+
 class AutoscalerDaemon:
     """Main autoscaler daemon service."""
     
-    def __init__(self, config_path: Optional[str] = None) -> None:
+    def __init__(self, config_path: Optional[str] = None, dry_run: bool = False) -> None:
         """Initialize autoscaler daemon.
         
         Args:
             config_path: Path to configuration file.
+            dry_run: Force dry-run mode regardless of the configuration file.
         """
         self.config_path = config_path
+        self.dry_run = dry_run
         self.config: Optional[AutoscalerConfig] = None
         self.config_manager: Optional[ConfigManager] = None
+        # Derived from config when it is loaded; the PID path is kept across
+        # reloads so cleanup removes the file that was actually created
+        self._pid_path: Optional[Path] = None
+        self._monitoring_interval = 0
         
         # Service components
         self.proxmox_client: Optional[ProxmoxClient] = None
@@ -47,12 +66,21 @@ class AutoscalerDaemon:
         # Runtime state
         self.is_running = False
         self.should_stop = False
+        # Created in start() so that it belongs to the running event loop
+        self._stop_event: Optional[asyncio.Event] = None
+        self._signal_tasks: Set[asyncio.Task] = set()
         self.main_task: Optional[asyncio.Task] = None
         self.health_check_task: Optional[asyncio.Task] = None
         
         # Statistics
+        # Wall-clock start for reporting; uptime uses the monotonic clock
         self.start_time: Optional[float] = None
+        self._start_monotonic: Optional[float] = None
         self.cycles_completed = 0
+        # Number of the scaling cycle in progress (or last run), added to
+        # every log record by _CycleLogFilter
+        self._cycle_no = 0
+        self._cycle_log_filter = _CycleLogFilter(self)
         self.cycles_failed = 0
         self.last_cycle_time: Optional[float] = None
         
@@ -67,11 +95,16 @@ class AutoscalerDaemon:
             
             # Load configuration
             self.config_manager = ConfigManager(self.config_path)
-            self.config = self.config_manager.load_config()
+            self.config = self._apply_overrides(self.config_manager.load_config())
+            self._pid_path = Path(self.config.global_config.pid_file)
+            self._monitoring_interval = self.config.global_config.monitoring_interval
             
             # Setup logging with configuration
             setup_logging(self.config.global_config, "lxc-autoscaler")
+            self._install_log_filter()
             logger.info("Logging configured")
+            if self.dry_run:
+                logger.info("Dry-run mode enabled")
             
             # Initialize Proxmox client
             self.proxmox_client = ProxmoxClient(self.config.proxmox)
@@ -123,7 +156,9 @@ class AutoscalerDaemon:
             logger.info("Starting LXC Autoscaler daemon")
             self.is_running = True
             self.should_stop = False
+            self._stop_event = asyncio.Event()
             self.start_time = time.time()
+            self._start_monotonic = time.monotonic()
             
             # Setup signal handlers
             self._setup_signal_handlers()
@@ -156,6 +191,7 @@ class AutoscalerDaemon:
         
         logger.info("Stopping LXC Autoscaler daemon")
         self.should_stop = True
+        self._stop_event.set()
         
         # Cancel running tasks
         if self.main_task and not self.main_task.done():
@@ -196,22 +232,22 @@ class AutoscalerDaemon:
         logger.info("Starting main processing loop")
         
         while not self.should_stop:
-            cycle_start = time.time()
+            cycle_start = time.monotonic()
+            self._cycle_no += 1
             
             try:
-                with with_log_context(logger, cycle=self.cycles_completed + 1):
-                    logger.debug("Starting scaling cycle")
-                    
-                    # Perform scaling evaluation and operations
-                    decisions = await self.scaling_engine.evaluate_and_scale()
-                    
-                    # Log cycle results
-                    scaling_count = sum(1 for d in decisions if d.requires_scaling)
-                    logger.info(f"Scaling cycle completed: {len(decisions)} containers evaluated, "
-                              f"{scaling_count} scaling operations executed")
-                    
-                    self.cycles_completed += 1
-                    self.last_cycle_time = time.time()
+                logger.debug("Starting scaling cycle")
+                
+                # Perform scaling evaluation and operations
+                decisions = await self.scaling_engine.evaluate_and_scale()
+                
+                # Log cycle results
+                scaling_count = sum(1 for d in decisions if d.requires_scaling)
+                logger.info(f"Scaling cycle completed: {len(decisions)} containers evaluated, "
+                          f"{scaling_count} scaling operations executed")
+                
+                self.cycles_completed += 1
+                self.last_cycle_time = time.time()
                 
             except ScalingEngineError as e:
                 logger.error(f"Scaling engine error: {e}")
@@ -227,16 +263,13 @@ class AutoscalerDaemon:
                 self.cycles_failed += 1
             
             # Calculate sleep time
-            cycle_duration = time.time() - cycle_start
-            sleep_time = max(0, self.config.global_config.monitoring_interval - cycle_duration)
+            cycle_duration = time.monotonic() - cycle_start
+            sleep_time = max(0, self._monitoring_interval - cycle_duration)
             
-            logger.debug(f"Cycle completed in {cycle_duration:.2f}s, sleeping for {sleep_time:.2f}s")
+            logger.debug("Cycle completed in %.2fs, sleeping for %.2fs", cycle_duration, sleep_time)
             
-            # Sleep until next cycle, checking for stop signal
-            sleep_elapsed = 0
-            while sleep_elapsed < sleep_time and not self.should_stop:
-                await asyncio.sleep(min(1.0, sleep_time - sleep_elapsed))
-                sleep_elapsed += 1.0
+            # Sleep until next cycle, waking early on stop
+            await self._sleep_until_stopped(sleep_time)
     
     async def _health_check_loop(self) -> None:
         """Health check monitoring loop."""
@@ -246,24 +279,54 @@ class AutoscalerDaemon:
         
         while not self.should_stop:
             try:
-                # Perform health checks
-                proxmox_healthy = await self.proxmox_client.health_check()
-                metrics_healthy = await self.metrics_collector.health_check()
-                scaling_healthy = await self.scaling_engine.health_check()
+                # Check all components concurrently so one slow check does
+                # not delay the others
+                results = await asyncio.wait_for(
+                    asyncio.gather(
+                        self.proxmox_client.health_check(),
+                        self.metrics_collector.health_check(),
+                        self.scaling_engine.health_check(),
+                        return_exceptions=True,
+                    ),
+                    timeout=health_check_interval * 0.8,
+                )
+                
+                # Exceptions count as unhealthy
+                healthy = [
+                    not isinstance(result, BaseException) and bool(result)
+                    for result in results
+                ]
                 
-                if not all([proxmox_healthy, metrics_healthy, scaling_healthy]):
+                if not all(healthy):
                     logger.warning("Health check failed - some components unhealthy")
-                    logger.warning(f"Proxmox: {'OK' if proxmox_healthy else 'FAIL'}")
-                    logger.warning(f"Metrics: {'OK' if metrics_healthy else 'FAIL'}")
-                    logger.warning(f"Scaling: {'OK' if scaling_healthy else 'FAIL'}")
+                    for component, ok, result in zip(
+                        ('Proxmox', 'Metrics', 'Scaling'), healthy, results
+                    ):
+                        if isinstance(result, BaseException):
+                            logger.warning(f"{component}: FAIL ({result!r})")
+                        else:
+                            logger.warning(f"{component}: {'OK' if ok else 'FAIL'}")
                 else:
                     logger.debug("Health check passed - all components healthy")
                 
+            except asyncio.TimeoutError:
+                logger.warning("Health check timed out - components unresponsive")
             except Exception as e:
                 log_exception(logger, "Health check error", e)
             
             # Sleep until next health check
-            await asyncio.sleep(health_check_interval)
+            await self._sleep_until_stopped(health_check_interval)
+    
+    async def _sleep_until_stopped(self, timeout: float) -> None:
+        """Sleep for the given time or until the daemon is asked to stop.
+        
+        Args:
+            timeout: Maximum time to sleep in seconds.
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     def _is_running_in_container(self) -> bool:
         """Detect if running inside a container.
@@ -287,31 +350,38 @@ class AutoscalerDaemon:
     
     def _setup_signal_handlers(self) -> None:
         """Setup signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating graceful shutdown")
-            asyncio.create_task(self.stop())
+        loop = asyncio.get_running_loop()
         
         # Handle termination signals
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, self._handle_stop_signal, signum)
         
         # Handle configuration reload signal
-        def reload_handler(signum, frame):
-            logger.info("Received SIGHUP, reloading configuration")
-            asyncio.create_task(self._reload_configuration())
-        
-        signal.signal(signal.SIGHUP, reload_handler)
+        loop.add_signal_handler(signal.SIGHUP, self._handle_reload_signal)
+    
+    def _handle_stop_signal(self, signum: int) -> None:
+        """Begin graceful shutdown; runs as an event loop callback."""
+        logger.info(f"Received signal {signum}, initiating graceful shutdown")
+        self._spawn_signal_task(self.stop())
+    
+    def _handle_reload_signal(self) -> None:
+        """Begin configuration reload; runs as an event loop callback."""
+        logger.info("Received SIGHUP, reloading configuration")
+        self._spawn_signal_task(self._reload_configuration())
+    
+    def _spawn_signal_task(self, coro: Awaitable[None]) -> None:
+        """Run a coroutine started from a signal, keeping a reference until done."""
+        task = asyncio.ensure_future(coro)
+        self._signal_tasks.add(task)
+        task.add_done_callback(self._signal_tasks.discard)
     
     async def _create_pid_file(self) -> None:
         """Create PID file."""
         try:
-            pid_path = Path(self.config.global_config.pid_file)
-            pid_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(pid_path, 'w') as f:
-                f.write(str(os.getpid()))
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._write_pid_file, self._pid_path)
             
-            logger.debug(f"PID file created: {pid_path}")
+            logger.debug("PID file created: %s", self._pid_path)
             
         except (OSError, PermissionError) as e:
             logger.warning(f"Failed to create PID file: {e}")
@@ -319,28 +389,88 @@ class AutoscalerDaemon:
     async def _remove_pid_file(self) -> None:
         """Remove PID file."""
         try:
-            pid_path = Path(self.config.global_config.pid_file)
-            if pid_path.exists():
-                pid_path.unlink()
-                logger.debug(f"PID file removed: {pid_path}")
+            if self._pid_path is None:
+                return
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(None, self._unlink_pid_file, self._pid_path):
+                logger.debug("PID file removed: %s", self._pid_path)
         except (OSError, PermissionError) as e:
             logger.warning(f"Failed to remove PID file: {e}")
     
+    @staticmethod
+    def _write_pid_file(pid_path: Path) -> None:
+        """Write the current PID, creating parent directories (blocking)."""
+        pid_path.parent.mkdir(parents=True, exist_ok=True)
+        pid_path.write_text(str(os.getpid()))
+    
+    @staticmethod
+    def _unlink_pid_file(pid_path: Path) -> bool:
+        """Remove a PID file if present (blocking).
+        
+        Returns:
+            True if the file was removed.
+        """
+        try:
+            pid_path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+    
+    def _install_log_filter(self) -> None:
+        """Attach the cycle number filter to the root log handlers."""
+        for handler in logging.getLogger().handlers:
+            handler.addFilter(self._cycle_log_filter)
+    
+    def _apply_overrides(self, config: AutoscalerConfig) -> AutoscalerConfig:
+        """Apply command line overrides to a loaded configuration.
+        
+        Args:
+            config: Configuration loaded from file.
+            
+        Returns:
+            Configuration with overrides applied.
+        """
+        if self.dry_run and not config.global_config.dry_run:
+            config = replace(
+                config, global_config=replace(config.global_config, dry_run=True)
+            )
+        return config
+    
     async def _reload_configuration(self) -> None:
         """Reload configuration from file."""
         try:
             logger.info("Reloading configuration")
             
-            # Reload config
-            old_config = self.config
-            self.config = self.config_manager.reload_config()
+            # Reload config; the manager hands back the same object when the
+            # file is unchanged, in which case there is nothing to apply
+            loaded_config = self.config_manager.get_config()
+            new_config = self.config_manager.reload_config()
+            if new_config is loaded_config:
+                return
             
-            # Update logging if changed
-            if (self.config.global_config.log_level != old_config.global_config.log_level or
-                self.config.global_config.log_file != old_config.global_config.log_file):
-                setup_logging(self.config.global_config, "lxc-autoscaler")
+            old_config = self.config
+            self.config = self._apply_overrides(new_config)
+            self._monitoring_interval = self.config.global_config.monitoring_interval
+            
+            # Update logging only if its settings changed; handlers hold
+            # open files
+            old_global = old_config.global_config
+            new_global = self.config.global_config
+            if (new_global.log_level, new_global.log_file) != (old_global.log_level, old_global.log_file):
+                setup_logging(new_global, "lxc-autoscaler")
+                self._install_log_filter()
                 logger.info("Logging configuration updated")
             
+            if self.config.proxmox != old_config.proxmox:
+                logger.warning("Proxmox connection settings changed; restart to apply them")
+            
+            # Hand the new configuration to the running components
+            added, removed, updated = diff_containers(
+                old_config.containers_by_vmid, self.config.containers_by_vmid
+            )
+            self.metrics_collector.apply_container_diff(self.config, added, removed, updated)
+            self.scaling_engine.apply_container_diff(self.config, added, removed, updated)
+            
             logger.info("Configuration reloaded successfully")
             
         except ConfigurationError as e:
@@ -354,7 +484,7 @@ class AutoscalerDaemon:
         Returns:
             Status dictionary.
         """
-        uptime = time.time() - self.start_time if self.start_time else 0
+        uptime = time.monotonic() - self._start_monotonic if self._start_monotonic else 0
         
         status = {
             'running': self.is_running,
@@ -405,10 +535,6 @@ async def main() -> None:
             config_manager = ConfigManager(args.config)
             config = config_manager.load_config()
             
-            # Override dry-run if specified
-            if args.dry_run:
-                config.global_config.dry_run = True
-            
             print("Configuration validation successful")
             print(f"Monitoring {len(config.containers)} containers")
             print(f"Proxmox host: {config.proxmox.host}:{config.proxmox.port}")
@@ -418,15 +544,9 @@ async def main() -> None:
             sys.exit(1)
     
     # Start daemon
-    daemon = AutoscalerDaemon(args.config)
+    daemon = AutoscalerDaemon(args.config, dry_run=args.dry_run)
     
     try:
-        # Override dry-run if specified
-        if args.dry_run:
-            await daemon.initialize()
-            daemon.config.global_config.dry_run = True
-            logger.info("Dry-run mode enabled")
-        
         await daemon.start()
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
@@ -438,8 +558,18 @@ async def main() -> None:
         sys.exit(1)
 
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop as the event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def cli_main() -> None:
     """Synchronous entry point for CLI."""
+    _install_event_loop_policy()
     asyncio.run(main())
 
 
@@ -1,11 +1,22 @@
 """Validation utilities for LXC Autoscaler."""
 
 import re
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, NoReturn, Optional, Union
 
 from .exceptions import ValidationError
 
 
+_HOSTNAME_LABEL_RE = re.compile(r'[a-zA-Z0-9](?:[a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?')
+_HOSTNAME_MAX_LENGTH = 253
+
+
+@lru_cache(maxsize=256)
+def _get_compiled(pattern: str, flags: int) -> "re.Pattern[str]":
+    """Compile a regex once and share it between validator instances."""
+    return re.compile(pattern, flags)
+
+
 class Validator:
     """Base validator class."""
     
@@ -117,16 +128,25 @@ class ChoiceValidator(Validator):
 class RegexValidator(Validator):
     """Validates that a string matches a regular expression."""
     
-    def __init__(self, field_name: str, pattern: str, flags: int = 0):
+    def __init__(
+        self,
+        field_name: str,
+        pattern: Union[str, "re.Pattern[str]"],
+        flags: int = 0,
+    ):
         """Initialize regex validator.
         
         Args:
             field_name: Name of the field being validated.
-            pattern: Regular expression pattern.
-            flags: Regex flags.
+            pattern: Regular expression pattern, or an already compiled one
+                which is used as is.
+            flags: Regex flags, only applied when compiling a string pattern.
         """
         super().__init__(field_name)
-        self.pattern = re.compile(pattern, flags)
+        if isinstance(pattern, str):
+            self.pattern = _get_compiled(pattern, flags)
+        else:
+            self.pattern = pattern
     
     def validate(self, value: Any) -> Any:
         """Validate value matches pattern."""
@@ -156,10 +176,10 @@ class LengthValidator(Validator):
     
     def validate(self, value: Any) -> Any:
         """Validate value length."""
-        if not hasattr(value, '__len__'):
-            raise ValidationError(f"{self.field_name} must have a length")
-        
-        length = len(value)
+        try:
+            length = len(value)
+        except TypeError:
+            raise ValidationError(f"{self.field_name} must have a length") from None
         
         if self.min_length is not None and length < self.min_length:
             raise ValidationError(f"{self.field_name} must have at least {self.min_length} characters")
@@ -170,46 +190,99 @@ class LengthValidator(Validator):
         return value
 
 
-class HostnameValidator(RegexValidator):
+@lru_cache(maxsize=256)
+def _shared_instance(cls: type, field_name: str) -> Validator:
+    """Allocate the one instance of a field-name-only validator for a field."""
+    return object.__new__(cls)
+
+
+class _SharedPerField:
+    """Mixin sharing one instance per validator class and field name.
+    
+    Only for validators configured by the field name alone: they hold no
+    other state, so equal constructions can return the same object.
+    """
+    
+    def __new__(cls, field_name: str):
+        return _shared_instance(cls, field_name)
+
+
+class HostnameValidator(_SharedPerField, RegexValidator):
     """Validates hostname format."""
     
     def __init__(self, field_name: str):
         """Initialize hostname validator."""
-        # Hostname regex pattern
-        pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?)*$'
-        super().__init__(field_name, pattern)
+        Validator.__init__(self, field_name)
+        # Matches a single label; validate() applies it to each dot-separated part
+        self.pattern = _HOSTNAME_LABEL_RE
+    
+    def validate(self, value: Any) -> Any:
+        """Validate value is a hostname.
+        
+        Labels are matched one at a time, which keeps matching linear in the
+        length of the value; over-long values are rejected before matching.
+        """
+        if not isinstance(value, str):
+            raise ValidationError(f"{self.field_name} must be a string")
+        
+        if (len(value) > _HOSTNAME_MAX_LENGTH
+                or not all(map(self.pattern.fullmatch, value.split('.')))):
+            raise ValidationError(f"{self.field_name} does not match required format")
+        
+        return value
 
 
-class PortValidator(RangeValidator):
+class PortValidator(_SharedPerField, RangeValidator):
     """Validates port number."""
     
     def __init__(self, field_name: str):
         """Initialize port validator."""
         super().__init__(field_name, 1, 65535)
+    
+    def validate(self, value: Any) -> Any:
+        """Validate port, falling back to the generic checks for errors."""
+        if type(value) is int and 1 <= value <= 65535:
+            return value
+        return super().validate(value)
 
 
-class PercentageValidator(RangeValidator):
+class PercentageValidator(_SharedPerField, RangeValidator):
     """Validates percentage value (0-100)."""
     
     def __init__(self, field_name: str):
         """Initialize percentage validator."""
         super().__init__(field_name, 0.0, 100.0)
+    
+    def validate(self, value: Any) -> Any:
+        """Validate percentage, falling back to the generic checks for errors."""
+        if isinstance(value, (int, float)) and 0.0 <= value <= 100.0:
+            return value
+        return super().validate(value)
 
 
-class VMIDValidator(RangeValidator):
+class VMIDValidator(_SharedPerField, RangeValidator):
     """Validates Proxmox VMID."""
     
     def __init__(self, field_name: str):
         """Initialize VMID validator."""
         super().__init__(field_name, 100, 999999999)
+    
+    def validate(self, value: Any) -> Any:
+        """Validate VMID, falling back to the generic checks for errors."""
+        if type(value) is int and 100 <= value <= 999999999:
+            return value
+        return super().validate(value)
 
 
-def validate_field(value: Any, validators: List[Validator]) -> Any:
+def validate_field(value: Any, validators: Iterable[Validator]) -> Any:
     """Validate a field using multiple validators.
     
+    Validators are consumed lazily and validation stops at the first
+    failure, so a tuple or generator works as well as a list.
+    
     Args:
         value: Value to validate.
-        validators: List of validators to apply.
+        validators: Validators to apply, in order.
         
     Returns:
         Validated value.
@@ -227,7 +300,7 @@ def validate_object(obj: dict, field_validators: dict) -> dict:
     
     Args:
         obj: Object to validate (as dictionary).
-        field_validators: Mapping of field names to validator lists.
+        field_validators: Mapping of field names to validator iterables.
         
     Returns:
         Validated object.
@@ -238,14 +311,53 @@ def validate_object(obj: dict, field_validators: dict) -> dict:
     validated = {}
     
     for field_name, validators in field_validators.items():
-        value = obj.get(field_name)
-        
         try:
-            validated[field_name] = validate_field(value, validators)
+            value = validate_field(obj.get(field_name), validators)
         except ValidationError as e:
-            # Re-raise with field context if not already present
-            if not e.message.startswith(field_name):
-                raise ValidationError(f"{field_name}: {e.message}")
-            raise
+            _raise_with_field_context(field_name, e)
+        validated[field_name] = value
     
-    return validated
\ No newline at end of file
+    return validated
+
+
+def compile_object_validator(
+    field_validators: Dict[str, Iterable[Validator]]
+) -> Callable[[dict], dict]:
+    """Bind field validators into a reusable object validator.
+    
+    The mapping is walked and each validator's ``validate`` method looked up
+    once, so validating many objects against a fixed schema only runs the
+    checks themselves.
+    
+    Args:
+        field_validators: Mapping of field names to validator iterables.
+        
+    Returns:
+        Function that validates an object like ``validate_object``.
+    """
+    plan = tuple(
+        (field_name, tuple(validator.validate for validator in validators))
+        for field_name, validators in field_validators.items()
+    )
+    
+    def validate(obj: dict) -> dict:
+        validated = {}
+        for field_name, checks in plan:
+            value = obj.get(field_name)
+            try:
+                for check in checks:
+                    value = check(value)
+            except ValidationError as e:
+                _raise_with_field_context(field_name, e)
+            validated[field_name] = value
+        return validated
+    
+    return validate
+
+
+def _raise_with_field_context(field_name: str, error: ValidationError) -> NoReturn:
+    """Re-raise a field validation error with field context if not already present."""
+    message = str(error)
+    if not message.startswith(field_name):
+        raise ValidationError(f"{field_name}: {message}") from error
+    raise error
\ No newline at end of file
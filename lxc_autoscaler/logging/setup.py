@@ -1,16 +1,74 @@
 """Logging configuration and setup for LXC Autoscaler."""
 
+from __future__ import annotations
+
 import logging
 import logging.handlers
 import os
 import sys
+import time
+from contextvars import ContextVar, Token
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+try:
+    import orjson
+    
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, default=str).decode('utf-8')
+except ImportError:  # pragma: no cover - optional speedup
+    import json
+    
+    def _json_dumps(data: Dict[str, Any]) -> str:
+        return json.dumps(data, default=str, separators=(',', ':'))
 
 from ..config.models import GlobalConfig
 
 
-class ColoredFormatter(logging.Formatter):
+# Standard LogRecord attributes; anything else on a record came from ``extra``
+_RESERVED_LOG_KEYS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+    'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process', 'message',
+    'taskName', 'asctime',
+})
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that formats the timestamp of each second only once."""
+    
+    # (second, datefmt, formatted time) of the last formatted record
+    _time_cache: Tuple[int, Optional[str], str] = (-1, None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the creation time of a record.
+        
+        Records logged within the same second reuse the cached strftime
+        result; the output is the same as logging.Formatter.formatTime.
+        
+        Args:
+            record: Log record to format.
+            datefmt: strftime format, or None for the default format.
+            
+        Returns:
+            Formatted creation time.
+        """
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            formatted = time.strftime(
+                datefmt or self.default_time_format, self.converter(second)
+            )
+            self._time_cache = (second, datefmt, formatted)
+        
+        if datefmt or not self.default_msec_format:
+            return formatted
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class ColoredFormatter(CachedTimeFormatter):
     """Colored log formatter for console output."""
     
     # ANSI color codes
@@ -23,6 +81,16 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize formatter; colors are only used when stdout is a terminal."""
+        super().__init__(*args, **kwargs)
+        self._use_color = sys.stdout.isatty()
+        # Keyed by level number, which hashes faster than the level name
+        self._colored_names = {
+            getattr(logging, level): f"{color}{level}{self.RESET}"
+            for level, color in self.COLORS.items()
+        }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors.
         
@@ -32,23 +100,20 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             Formatted log message with colors.
         """
-        # Apply color to level name
-        level_name = record.levelname
-        if level_name in self.COLORS:
-            colored_level = f"{self.COLORS[level_name]}{level_name}{self.RESET}"
-            record.levelname = colored_level
-        
-        # Format the message
-        formatted = super().format(record)
-        
-        # Reset level name for other formatters
-        record.levelname = level_name
+        if not self._use_color:
+            return super().format(record)
         
-        return formatted
+        # Apply color to level name, then reset it for other formatters
+        level_name = record.levelname
+        record.levelname = self._colored_names.get(record.levelno, level_name)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = level_name
 
 
-class StructuredFormatter(logging.Formatter):
-    """Structured JSON-like formatter for log files."""
+class StructuredFormatter(CachedTimeFormatter):
+    """Structured JSON formatter for log files, one object per line."""
     
     def format(self, record: logging.LogRecord) -> str:
         """Format log record in structured format.
@@ -57,7 +122,7 @@ class StructuredFormatter(logging.Formatter):
             record: Log record to format.
             
         Returns:
-            Structured log message.
+            Log record serialized as a single-line JSON object.
         """
         # Basic structured fields
         log_data = {
@@ -83,42 +148,35 @@ class StructuredFormatter(logging.Formatter):
         
         # Add custom fields from extra parameter
         for key, value in record.__dict__.items():
-            if key not in ['name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
-                          'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
-                          'thread', 'threadName', 'processName', 'process', 'message']:
+            if key not in _RESERVED_LOG_KEYS:
                 log_data[key] = value
         
-        # Format as key=value pairs for easier parsing
-        parts = []
-        for key, value in log_data.items():
-            if isinstance(value, str) and (' ' in value or '=' in value):
-                parts.append(f'{key}="{value}"')
-            else:
-                parts.append(f'{key}={value}')
-        
-        return ' '.join(parts)
+        # Values that are not JSON types (e.g. from ``extra``) are stringified
+        return _json_dumps(log_data)
+
+
+# Whether the process runs in a container cannot change while it runs
+_IS_CONTAINER = (
+    # Docker
+    os.path.exists('/.dockerenv')
+    # Kubernetes
+    or bool(os.getenv('KUBERNETES_SERVICE_HOST'))
+    # General container environment variable
+    or bool(os.getenv('CONTAINER'))
+    # LXC Autoscaler specific variable
+    or bool(os.getenv('LXC_AUTOSCALER_CONTAINER'))
+)
 
 
 def _is_running_in_container() -> bool:
     """Detect if running inside a container.
     
+    Detection runs once at import time.
+    
     Returns:
         True if running in a container environment.
     """
-    # Check for container environment indicators
-    container_indicators = [
-        # Docker
-        os.path.exists('/.dockerenv'),
-        # Kubernetes
-        bool(os.getenv('KUBERNETES_SERVICE_HOST')),
-        # General container environment variable
-        bool(os.getenv('CONTAINER')),
-        # LXC Autoscaler specific variable
-        bool(os.getenv('LXC_AUTOSCALER_CONTAINER')),
-    ]
-    
-    return any(container_indicators)
+    return _IS_CONTAINER
 
 
 def setup_logging(config: GlobalConfig, service_name: str = "lxc-autoscaler") -> None:
@@ -147,7 +205,7 @@ def setup_logging(config: GlobalConfig, service_name: str = "lxc-autoscaler") ->
     
     # Use simpler format in containers for better log aggregation
     if is_container:
-        console_formatter = logging.Formatter(
+        console_formatter = CachedTimeFormatter(
             fmt='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -188,9 +246,7 @@ def setup_logging(config: GlobalConfig, service_name: str = "lxc-autoscaler") ->
             logging.warning(f"Failed to setup file logging: {e}")
     
     # Set up specific logger levels for noisy libraries
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('requests').setLevel(logging.WARNING)
-    logging.getLogger('proxmoxer').setLevel(logging.INFO)
+    logging.getLogger('aiohttp').setLevel(logging.WARNING)
     
     # Log initial setup information
     logging.info(f"{service_name} logging initialized")
@@ -242,8 +298,37 @@ def log_with_context(
     logger.log(level, message, extra=context)
 
 
+# Context fields added to records created in the current thread or task; the
+# default is read-only as it is shared by every context
+_log_context: ContextVar[Mapping[str, Any]] = ContextVar(
+    '_log_context', default=MappingProxyType({})
+)
+_context_factory_installed = False
+
+
+def _install_context_factory() -> None:
+    """Install a record factory that applies the current log context, once."""
+    global _context_factory_installed
+    if _context_factory_installed:
+        return
+    original_factory = logging.getLogRecordFactory()
+    
+    def record_factory(*args, **kwargs) -> logging.LogRecord:
+        record = original_factory(*args, **kwargs)
+        for key, value in _log_context.get().items():
+            setattr(record, key, value)
+        return record
+    
+    logging.setLogRecordFactory(record_factory)
+    _context_factory_installed = True
+
+
 class LogContextManager:
-    """Context manager for adding context to all log messages within a block."""
+    """Context manager for adding context to all log messages within a block.
+    
+    The context is held in a context variable, so nested blocks merge their
+    fields and concurrent asyncio tasks do not see each other's context.
+    """
     
     def __init__(self, logger: logging.Logger, **context):
         """Initialize log context manager.
@@ -254,24 +339,19 @@ class LogContextManager:
         """
         self.logger = logger
         self.context = context
-        self.original_factory = None
+        self._token: Optional[Token[Mapping[str, Any]]] = None
     
     def __enter__(self):
         """Enter context manager."""
-        self.original_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = self.original_factory(*args, **kwargs)
-            for key, value in self.context.items():
-                setattr(record, key, value)
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        _install_context_factory()
+        self._token = _log_context.set({**_log_context.get(), **self.context})
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context manager."""
-        logging.setLogRecordFactory(self.original_factory)
+        if self._token is not None:
+            _log_context.reset(self._token)
+            self._token = None
 
 
 def with_log_context(logger: logging.Logger, **context):
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..api.exceptions import ProxmoxAPIError, ProxmoxResourceNotFoundError
 from ..api.proxmox_client import ProxmoxClient
@@ -22,6 +22,9 @@ class MetricsCollectionError(Exception):
 class MetricsCollector:
     """Collects and manages metrics from Proxmox cluster."""
     
+    # Containers collected concurrently, to avoid overwhelming Proxmox
+    MAX_CONCURRENT_COLLECTIONS = 5
+    
     def __init__(self, client: ProxmoxClient, config: AutoscalerConfig) -> None:
         """Initialize metrics collector.
         
@@ -33,8 +36,32 @@ class MetricsCollector:
         self.config = config
         self.container_metrics: Dict[int, ContainerMetrics] = {}
         self.node_metrics: Dict[str, NodeMetrics] = {}
+        # time.monotonic() at the end of the last collection
         self._last_collection_time: Optional[float] = None
+        self._container_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_COLLECTIONS)
+        
+    def apply_container_diff(
+        self,
+        config: AutoscalerConfig,
+        added: List[ContainerConfig],
+        removed: List[int],
+        updated: List[ContainerConfig],
+    ) -> None:
+        """Switch to a reloaded configuration.
+        
+        Metrics of removed containers are dropped; history of the remaining
+        containers is kept.
         
+        Args:
+            config: New autoscaler configuration.
+            added: Containers that were added.
+            removed: VMIDs of containers that were removed.
+            updated: Containers whose configuration changed.
+        """
+        self.config = config
+        for vmid in removed:
+            self.container_metrics.pop(vmid, None)
+    
     async def collect_all_metrics(self) -> ClusterMetrics:
         """Collect metrics for all monitored containers and nodes.
         
@@ -46,7 +73,7 @@ class MetricsCollector:
         """
         try:
             logger.debug("Starting metrics collection cycle")
-            collection_start = time.time()
+            collection_start = time.monotonic()
             
             # Collect node metrics
             await self._collect_node_metrics()
@@ -57,10 +84,11 @@ class MetricsCollector:
             # Build cluster metrics
             cluster_metrics = self._build_cluster_metrics()
             
-            collection_time = time.time() - collection_start
+            collection_end = time.monotonic()
+            collection_time = collection_end - collection_start
             logger.debug(f"Metrics collection completed in {collection_time:.2f}s")
             
-            self._last_collection_time = time.time()
+            self._last_collection_time = collection_end
             return cluster_metrics
             
         except Exception as e:
@@ -79,18 +107,27 @@ class MetricsCollector:
                 if node_info.get('status') == 'online'
             ]
             
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+            # Replace the node metrics in one step; nodes that went offline
+            # or failed to report are dropped
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            self.node_metrics = dict(
+                result for result in results if isinstance(result, tuple)
+            )
                 
         except ProxmoxAPIError as e:
             logger.error(f"Failed to collect node metrics: {e}")
             raise MetricsCollectionError(f"Node metrics collection failed: {e}")
     
-    async def _collect_single_node_metrics(self, node_name: str) -> None:
+    async def _collect_single_node_metrics(
+        self, node_name: str
+    ) -> Optional[Tuple[str, NodeMetrics]]:
         """Collect metrics for a single node.
         
         Args:
             node_name: Name of the node.
+            
+        Returns:
+            Tuple of (node name, node metrics), or None if collection failed.
         """
         try:
             logger.debug(f"Collecting metrics for node {node_name}")
@@ -100,103 +137,135 @@ class MetricsCollector:
             
             # Create node metrics
             node_metrics = NodeMetrics.from_node_status(node_name, status_data)
-            self.node_metrics[node_name] = node_metrics
             
             logger.debug(f"Node {node_name}: CPU {node_metrics.cpu_usage_percent:.1f}%, "
                         f"Memory {node_metrics.memory_usage_percent:.1f}%")
             
+            return node_name, node_metrics
+            
         except ProxmoxAPIError as e:
             logger.warning(f"Failed to collect metrics for node {node_name}: {e}")
+            return None
     
     async def _collect_container_metrics(self) -> None:
         """Collect metrics for all monitored containers."""
-        # Get containers to monitor
-        container_configs = [
-            container for container in self.config.containers
-            if container.enabled
-        ]
+        container_configs = self.config.enabled_containers
         
         if not container_configs:
             logger.warning("No containers configured for monitoring")
             return
         
-        # Collect metrics for each container concurrently
-        tasks = [
-            self._collect_single_container_metrics(container_config)
-            for container_config in container_configs
-        ]
-        
-        # Execute with limited concurrency to avoid overwhelming Proxmox
-        semaphore = asyncio.Semaphore(5)
-        
-        async def collect_with_semaphore(container_config: ContainerConfig):
-            async with semaphore:
-                return await self._collect_single_container_metrics(container_config)
-        
-        semaphore_tasks = [
-            collect_with_semaphore(config) for config in container_configs
-        ]
+        # One cluster-wide request replaces a node lookup and a status
+        # request per container
+        try:
+            vm_resources: Optional[Dict[int, Dict[str, Any]]] = (
+                await self.client.get_cluster_vm_resources()
+            )
+        except ProxmoxAPIError as e:
+            logger.warning(f"Cluster resources unavailable, querying containers individually: {e}")
+            vm_resources = None
         
-        await asyncio.gather(*semaphore_tasks, return_exceptions=True)
+        # Collect metrics for each container concurrently
+        await asyncio.gather(
+            *(
+                self._collect_with_semaphore(container_config, vm_resources)
+                for container_config in container_configs
+            ),
+            return_exceptions=True,
+        )
+    
+    async def _collect_with_semaphore(
+        self,
+        container_config: ContainerConfig,
+        vm_resources: Optional[Dict[int, Dict[str, Any]]],
+    ) -> None:
+        """Collect metrics for a container with limited concurrency."""
+        async with self._container_semaphore:
+            await self._collect_single_container_metrics(container_config, vm_resources)
     
-    async def _collect_single_container_metrics(self, container_config: ContainerConfig) -> None:
+    async def _collect_single_container_metrics(
+        self,
+        container_config: ContainerConfig,
+        vm_resources: Optional[Dict[int, Dict[str, Any]]] = None,
+    ) -> None:
         """Collect metrics for a single container.
         
         Args:
             container_config: Container configuration.
+            vm_resources: Cluster guest resources indexed by VMID. When given,
+                node and status are taken from it, and only config and RRD
+                data are requested per running container.
         """
         vmid = container_config.vmid
         
         try:
             logger.debug(f"Collecting metrics for container {vmid}")
             
-            # Find which node the container is on
-            node = await self.client.find_container_node(vmid)
-            if not node:
-                logger.warning(f"Container {vmid} not found on any node")
-                return
-            
-            # Get container status and config
-            status_task = self.client.get_container_status(node, vmid)
-            config_task = self.client.get_container_config(node, vmid)
-            rrd_task = self.client.get_container_rrd_data(
-                node, vmid, timeframe="hour", cf="AVERAGE"
-            )
+            if vm_resources is not None:
+                status = vm_resources.get(vmid)
+                if not status or status.get('type') != 'lxc':
+                    logger.warning(f"Container {vmid} not found on any node")
+                    return
+                node = status['node']
+                
+                if status.get('status') == 'running':
+                    # Cores come from the container config: the snapshot's
+                    # maxcpu is capped by cpulimit, and resizes write cores back
+                    config, rrd_data = await asyncio.gather(
+                        self.client.get_container_config(node, vmid),
+                        self.client.get_container_rrd_data(
+                            node, vmid, timeframe="hour", cf="AVERAGE"
+                        ),
+                    )
+                else:
+                    config = {'hostname': status.get('name', f'ct-{vmid}')}
+                    rrd_data = None
+            else:
+                # Find which node the container is on
+                node = await self.client.find_container_node(vmid)
+                if not node:
+                    logger.warning(f"Container {vmid} not found on any node")
+                    return
+                
+                # Get container status and config
+                status_task = self.client.get_container_status(node, vmid)
+                config_task = self.client.get_container_config(node, vmid)
+                rrd_task = self.client.get_container_rrd_data(
+                    node, vmid, timeframe="hour", cf="AVERAGE"
+                )
+                
+                status, config, rrd_data = await asyncio.gather(
+                    status_task, config_task, rrd_task
+                )
             
-            status, config, rrd_data = await asyncio.gather(
-                status_task, config_task, rrd_task
-            )
+            container_metrics = self.container_metrics.get(vmid)
             
             # Check if container is running
             if status.get('status') != 'running':
                 logger.debug(f"Container {vmid} is not running (status: {status.get('status')})")
                 # Keep container in metrics but don't update resource data
-                if vmid in self.container_metrics:
-                    self.container_metrics[vmid].status = status.get('status', 'unknown')
+                if container_metrics is not None:
+                    container_metrics.status = status.get('status', 'unknown')
                 return
             
             # Get or create container metrics object
-            if vmid not in self.container_metrics:
-                self.container_metrics[vmid] = ContainerMetrics(
+            if container_metrics is None:
+                container_metrics = self.container_metrics[vmid] = ContainerMetrics(
                     vmid=vmid,
                     node=node,
                     name=config.get('hostname', f'ct-{vmid}'),
                     status=status.get('status', 'unknown'),
                     uptime=int(status.get('uptime', 0)),
                 )
+            else:
+                container_metrics.status = status.get('status', 'unknown')
+                container_metrics.uptime = int(status.get('uptime', 0))
+                container_metrics.node = node
             
-            container_metrics = self.container_metrics[vmid]
-            container_metrics.status = status.get('status', 'unknown')
-            container_metrics.uptime = int(status.get('uptime', 0))
-            container_metrics.node = node
-            
-            # Process RRD data to get latest metrics
+            # Only the most recent RRD point is turned into metrics; history
+            # is accumulated one point per collection cycle
             if rrd_data:
-                # Get the most recent data point
-                latest_rrd = rrd_data[-1] if rrd_data else {}
-                
-                # Create resource metrics from RRD data
-                resource_metrics = ResourceMetrics.from_rrd_data(latest_rrd, config)
+                resource_metrics = ResourceMetrics.from_rrd_data(rrd_data[-1], config)
                 
                 # Add to container metrics
                 container_metrics.add_metrics(resource_metrics)
@@ -208,8 +277,7 @@ class MetricsCollector:
         except ProxmoxResourceNotFoundError:
             logger.warning(f"Container {vmid} not found")
             # Remove from metrics if it was being tracked
-            if vmid in self.container_metrics:
-                del self.container_metrics[vmid]
+            self.container_metrics.pop(vmid, None)
         except ProxmoxAPIError as e:
             logger.error(f"Failed to collect metrics for container {vmid}: {e}")
         except Exception as e:
@@ -224,30 +292,33 @@ class MetricsCollector:
         # Container statistics
         container_list = list(self.container_metrics.values())
         total_containers = len(container_list)
-        running_containers = sum(
-            1 for c in container_list 
-            if c.status == 'running'
-        )
+        running_containers = 0
+        for c in container_list:
+            if c.status == 'running':
+                running_containers += 1
         
-        # Calculate cluster totals and averages
+        # Calculate cluster totals and averages in a single pass
         node_list = list(self.node_metrics.values())
+        total_cpu_cores = 0
+        total_memory_gb = 0.0
+        cpu_usage_sum = 0.0
+        memory_usage_sum = 0.0
+        max_cpu_usage = 0.0
+        max_memory_usage = 0.0
+        for n in node_list:
+            # Estimate cores from load average length or use a default
+            total_cpu_cores += len(n.load_average) if n.load_average else 1
+            total_memory_gb += n.memory_total_gb
+            cpu_usage_sum += n.cpu_usage_percent
+            memory_usage_sum += n.memory_usage_percent
+            if n.cpu_usage_percent > max_cpu_usage:
+                max_cpu_usage = n.cpu_usage_percent
+            if n.memory_usage_percent > max_memory_usage:
+                max_memory_usage = n.memory_usage_percent
         
-        if node_list:
-            total_cpu_cores = sum(
-                # Estimate cores from load average length or use a default
-                len(n.load_average) if n.load_average else 1
-                for n in node_list
-            )
-            
-            total_memory_gb = sum(n.memory_total_gb for n in node_list)
-            
-            avg_cpu_usage = sum(n.cpu_usage_percent for n in node_list) / len(node_list)
-            avg_memory_usage = sum(n.memory_usage_percent for n in node_list) / len(node_list)
-        else:
-            total_cpu_cores = 0
-            total_memory_gb = 0.0
-            avg_cpu_usage = 0.0
-            avg_memory_usage = 0.0
+        node_count = len(node_list)
+        avg_cpu_usage = cpu_usage_sum / node_count if node_count else 0.0
+        avg_memory_usage = memory_usage_sum / node_count if node_count else 0.0
         
         return ClusterMetrics(
             total_containers=total_containers,
@@ -258,6 +329,8 @@ class MetricsCollector:
             avg_memory_usage_percent=avg_memory_usage,
             node_metrics=node_list,
             container_metrics=container_list,
+            max_node_cpu_usage_percent=max_cpu_usage,
+            max_node_memory_usage_percent=max_memory_usage,
         )
     
     def get_container_metrics(self, vmid: int) -> Optional[ContainerMetrics]:
@@ -294,7 +367,7 @@ class MetricsCollector:
         if self._last_collection_time is None:
             return False
         
-        age = time.time() - self._last_collection_time
+        age = time.monotonic() - self._last_collection_time
         return age <= max_age_seconds
     
     def get_collection_age(self) -> Optional[float]:
@@ -306,7 +379,7 @@ class MetricsCollector:
         if self._last_collection_time is None:
             return None
         
-        return time.time() - self._last_collection_time
+        return time.monotonic() - self._last_collection_time
     
     async def health_check(self) -> bool:
         """Perform health check on metrics collection.
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
+import sys
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Deque, Dict, List, Optional
 
 
-@dataclass
+# Metrics objects are numerous (100 data points per container); slots need
+# Python 3.10+
+_METRICS_DATACLASS = {}
+if sys.version_info >= (3, 10):
+    _METRICS_DATACLASS['slots'] = True
+
+# Data points of history kept per container
+MAX_HISTORY = 100
+
+# Prefix sums are rebased before they grow large enough to lose precision
+_PREFIX_SUM_REBASE = 1e6
+
+
+@dataclass(frozen=True, **_METRICS_DATACLASS)
 class ResourceMetrics:
-    """Resource usage metrics for a container."""
+    """Resource usage metrics for a container.
+    
+    Data points are immutable once sampled, which also makes them hashable.
+    """
     
     timestamp: float
     cpu_usage_percent: float
@@ -66,7 +85,7 @@ class ResourceMetrics:
         )
 
 
-@dataclass
+@dataclass(**_METRICS_DATACLASS)
 class ContainerMetrics:
     """Metrics for a specific container."""
     
@@ -76,12 +95,25 @@ class ContainerMetrics:
     status: str
     uptime: int
     current_metrics: Optional[ResourceMetrics] = None
-    historical_metrics: List[ResourceMetrics] = None
+    # Ring buffer of the last MAX_HISTORY data points, oldest first
+    historical_metrics: Deque[ResourceMetrics] = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY)
+    )
+    
+    # Prefix sums of CPU and memory usage over the history, with one
+    # leading entry, so window averages need no scan of the history
+    _cpu_totals: Deque[float] = field(init=False, repr=False, compare=False)
+    _memory_totals: Deque[float] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Initialize historical metrics if not provided."""
-        if self.historical_metrics is None:
-            self.historical_metrics = []
+        """Bound historical metrics passed in as another sequence."""
+        if getattr(self.historical_metrics, 'maxlen', None) != MAX_HISTORY:
+            self.historical_metrics = deque(self.historical_metrics or (), maxlen=MAX_HISTORY)
+        
+        self._cpu_totals = deque([0.0], maxlen=MAX_HISTORY + 1)
+        self._memory_totals = deque([0.0], maxlen=MAX_HISTORY + 1)
+        for metrics in self.historical_metrics:
+            self._add_to_totals(metrics)
     
     def add_metrics(self, metrics: ResourceMetrics) -> None:
         """Add new metrics data point.
@@ -90,11 +122,26 @@ class ContainerMetrics:
             metrics: Resource metrics to add.
         """
         self.current_metrics = metrics
+        # The oldest data point is evicted once the buffer is full
         self.historical_metrics.append(metrics)
+        self._add_to_totals(metrics)
+    
+    def _add_to_totals(self, metrics: ResourceMetrics) -> None:
+        """Extend the prefix sums by a new data point."""
+        cpu_totals = self._cpu_totals
+        memory_totals = self._memory_totals
+        cpu_totals.append(cpu_totals[-1] + metrics.cpu_usage_percent)
+        memory_totals.append(memory_totals[-1] + metrics.memory_usage_percent)
         
-        # Keep only last 100 data points to prevent memory growth
-        if len(self.historical_metrics) > 100:
-            self.historical_metrics = self.historical_metrics[-100:]
+        if cpu_totals[-1] > _PREFIX_SUM_REBASE or memory_totals[-1] > _PREFIX_SUM_REBASE:
+            cpu_base = cpu_totals[0]
+            memory_base = memory_totals[0]
+            self._cpu_totals = deque(
+                (total - cpu_base for total in cpu_totals), maxlen=MAX_HISTORY + 1
+            )
+            self._memory_totals = deque(
+                (total - memory_base for total in memory_totals), maxlen=MAX_HISTORY + 1
+            )
     
     def get_average_metrics(self, periods: int = 3) -> Optional[ResourceMetrics]:
         """Get average metrics over the last N periods.
@@ -108,13 +155,12 @@ class ContainerMetrics:
         if len(self.historical_metrics) < periods:
             return None
         
-        recent_metrics = self.historical_metrics[-periods:]
-        
-        avg_cpu = sum(m.cpu_usage_percent for m in recent_metrics) / len(recent_metrics)
-        avg_memory = sum(m.memory_usage_percent for m in recent_metrics) / len(recent_metrics)
+        # Window sums are differences of the prefix sums
+        avg_cpu = (self._cpu_totals[-1] - self._cpu_totals[-1 - periods]) / periods
+        avg_memory = (self._memory_totals[-1] - self._memory_totals[-1 - periods]) / periods
         
         # Use the most recent values for other fields
-        latest = recent_metrics[-1]
+        latest = self.historical_metrics[-1]
         
         return ResourceMetrics(
             timestamp=latest.timestamp,
@@ -137,13 +183,17 @@ class ContainerMetrics:
         if len(self.historical_metrics) < periods:
             return None
         
-        recent_metrics = self.historical_metrics[-periods:]
-        
-        peak_cpu = max(m.cpu_usage_percent for m in recent_metrics)
-        peak_memory = max(m.memory_usage_percent for m in recent_metrics)
-        
         # Use the most recent values for other fields
-        latest = recent_metrics[-1]
+        latest = self.historical_metrics[-1]
+        
+        # Track both peaks in one pass over the newest data points
+        peak_cpu = latest.cpu_usage_percent
+        peak_memory = latest.memory_usage_percent
+        for m in islice(reversed(self.historical_metrics), 1, periods):
+            if m.cpu_usage_percent > peak_cpu:
+                peak_cpu = m.cpu_usage_percent
+            if m.memory_usage_percent > peak_memory:
+                peak_memory = m.memory_usage_percent
         
         return ResourceMetrics(
             timestamp=latest.timestamp,
@@ -155,7 +205,7 @@ class ContainerMetrics:
         )
 
 
-@dataclass
+@dataclass(**_METRICS_DATACLASS)
 class NodeMetrics:
     """Metrics for a Proxmox node."""
     
@@ -204,7 +254,7 @@ class NodeMetrics:
         )
 
 
-@dataclass
+@dataclass(**_METRICS_DATACLASS)
 class ClusterMetrics:
     """Metrics for the entire Proxmox cluster."""
     
@@ -216,20 +266,35 @@ class ClusterMetrics:
     avg_memory_usage_percent: float
     node_metrics: List[NodeMetrics]
     container_metrics: List[ContainerMetrics]
+    # Highest node usage, so safety checks need not scan the nodes;
+    # None when not computed
+    max_node_cpu_usage_percent: Optional[float] = None
+    max_node_memory_usage_percent: Optional[float] = None
+    _availability: Optional[Dict[str, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def get_resource_availability(self) -> Dict[str, float]:
         """Calculate available cluster resources.
         
+        The result is computed on first use and cached; cluster metrics are a
+        snapshot of a single collection cycle.
+        
         Returns:
             Dictionary with available CPU and memory percentages.
         """
-        if not self.node_metrics:
-            return {'cpu_available_percent': 0.0, 'memory_available_percent': 0.0}
+        if self._availability is not None:
+            return self._availability
         
-        avg_cpu_available = 100 - self.avg_cpu_usage_percent
-        avg_memory_available = 100 - self.avg_memory_usage_percent
+        if not self.node_metrics:
+            availability = {'cpu_available_percent': 0.0, 'memory_available_percent': 0.0}
+        else:
+            avg_cpu_available = 100 - self.avg_cpu_usage_percent
+            avg_memory_available = 100 - self.avg_memory_usage_percent
+            availability = {
+                'cpu_available_percent': max(0, avg_cpu_available),
+                'memory_available_percent': max(0, avg_memory_available),
+            }
         
-        return {
-            'cpu_available_percent': max(0, avg_cpu_available),
-            'memory_available_percent': max(0, avg_memory_available),
-        }
\ No newline at end of file
+        self._availability = availability
+        return availability
\ No newline at end of file
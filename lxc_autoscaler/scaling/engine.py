@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 from ..api.exceptions import ProxmoxAPIError
 from ..api.proxmox_client import ProxmoxClient
@@ -50,12 +50,54 @@ class ScalingEngine:
         # Track scaling operations and history
         self.active_operations: Dict[int, ScalingOperation] = {}
         self.scaling_history: Dict[int, ScalingHistory] = {}
+        # Totals over scaling_history, kept up to date for status reporting
+        self._total_operations = 0
+        self._total_successes = 0
+        # Last NO_ACTION decision per container with the values it was built
+        # from; steady-state cycles return it instead of allocating a new one
+        self._no_action_cache: Dict[int, Tuple[tuple, ScalingDecision]] = {}
         
         # Safety mechanisms
         self._operation_semaphore = asyncio.Semaphore(
             self.config.safety.max_concurrent_operations
         )
         
+    def apply_container_diff(
+        self,
+        config: AutoscalerConfig,
+        added: List[ContainerConfig],
+        removed: List[int],
+        updated: List[ContainerConfig],
+    ) -> None:
+        """Switch to a reloaded configuration, keeping state of unchanged containers.
+        
+        Scaling history is dropped for removed containers. Operations that
+        are already running finish normally.
+        
+        Args:
+            config: New autoscaler configuration.
+            added: Containers that were added.
+            removed: VMIDs of containers that were removed.
+            updated: Containers whose configuration changed.
+        """
+        if config.safety.max_concurrent_operations != self.config.safety.max_concurrent_operations:
+            self._operation_semaphore = asyncio.Semaphore(
+                config.safety.max_concurrent_operations
+            )
+        self.config = config
+        
+        for vmid in removed:
+            history = self.scaling_history.pop(vmid, None)
+            if history is not None:
+                self._total_operations -= history.operation_count
+                self._total_successes -= history.success_count
+            self._no_action_cache.pop(vmid, None)
+        
+        logger.info(
+            "Scaling configuration updated: %d added, %d removed, %d changed containers",
+            len(added), len(removed), len(updated)
+        )
+    
     async def evaluate_and_scale(self) -> List[ScalingDecision]:
         """Evaluate all containers and perform scaling decisions.
         
@@ -73,8 +115,9 @@ class ScalingEngine:
                 logger.warning("Cluster safety constraints violated, skipping scaling")
                 return []
             
-            # Generate scaling decisions for all containers
-            decisions = await self._generate_scaling_decisions(cluster_metrics)
+            # Generate scaling decisions for all containers against one
+            # timestamp, so cooldowns are judged consistently within a cycle
+            decisions = await self._generate_scaling_decisions(cluster_metrics, time.monotonic())
             
             # Execute scaling operations
             executed_decisions = []
@@ -88,12 +131,12 @@ class ScalingEngine:
             
             # Log summary
             scaling_count = sum(1 for d in executed_decisions if d.requires_scaling)
-            logger.info(f"Scaling evaluation completed: {scaling_count} scaling operations executed")
+            logger.info("Scaling evaluation completed: %d scaling operations executed", scaling_count)
             
             return executed_decisions
             
         except Exception as e:
-            logger.error(f"Scaling evaluation failed: {e}")
+            logger.error("Scaling evaluation failed: %s", e)
             raise ScalingEngineError(f"Scaling evaluation failed: {e}")
     
     def _check_cluster_safety(self, cluster_metrics: ClusterMetrics) -> bool:
@@ -105,52 +148,74 @@ class ScalingEngine:
         Returns:
             True if safe to perform scaling operations.
         """
-        if not self.config.safety.enable_host_protection:
+        safety = self.config.safety
+        if not safety.enable_host_protection:
             return True
+        cpu_threshold = safety.max_cpu_usage_threshold
+        memory_threshold = safety.max_memory_usage_threshold
+        
+        # Check if any node is under severe stress. The maxima from collection
+        # clear healthy clusters at once; nodes are only scanned to report
+        # the offending one.
+        max_cpu = cluster_metrics.max_node_cpu_usage_percent
+        max_memory = cluster_metrics.max_node_memory_usage_percent
+        nodes_healthy = (
+            max_cpu is not None and max_memory is not None
+            and max_cpu <= cpu_threshold and max_memory <= memory_threshold
+        )
         
-        # Check if any node is under severe stress
-        for node_metrics in cluster_metrics.node_metrics:
-            if node_metrics.cpu_usage_percent > self.config.safety.max_cpu_usage_threshold:
-                logger.warning(f"Node {node_metrics.node_name} CPU usage too high: "
-                             f"{node_metrics.cpu_usage_percent:.1f}%")
-                return False
-            
-            if node_metrics.memory_usage_percent > self.config.safety.max_memory_usage_threshold:
-                logger.warning(f"Node {node_metrics.node_name} memory usage too high: "
-                             f"{node_metrics.memory_usage_percent:.1f}%")
-                return False
+        if not nodes_healthy:
+            for node_metrics in cluster_metrics.node_metrics:
+                if node_metrics.cpu_usage_percent > cpu_threshold:
+                    logger.warning("Node %s CPU usage too high: %.1f%%",
+                                   node_metrics.node_name, node_metrics.cpu_usage_percent)
+                    return False
+                
+                if node_metrics.memory_usage_percent > memory_threshold:
+                    logger.warning("Node %s memory usage too high: %.1f%%",
+                                   node_metrics.node_name, node_metrics.memory_usage_percent)
+                    return False
         
         # Check if cluster resources are available for scale-up operations
         availability = cluster_metrics.get_resource_availability()
         if availability['cpu_available_percent'] < 10:
-            logger.warning(f"Cluster CPU availability too low: "
-                         f"{availability['cpu_available_percent']:.1f}%")
+            logger.warning("Cluster CPU availability too low: %.1f%%",
+                           availability['cpu_available_percent'])
             return False
         
         if availability['memory_available_percent'] < 10:
-            logger.warning(f"Cluster memory availability too low: "
-                         f"{availability['memory_available_percent']:.1f}%")
+            logger.warning("Cluster memory availability too low: %.1f%%",
+                           availability['memory_available_percent'])
             return False
         
         return True
     
-    async def _generate_scaling_decisions(self, cluster_metrics: ClusterMetrics) -> List[ScalingDecision]:
+    async def _generate_scaling_decisions(
+        self,
+        cluster_metrics: ClusterMetrics,
+        now: Optional[float] = None,
+    ) -> List[ScalingDecision]:
         """Generate scaling decisions for all monitored containers.
         
         Args:
             cluster_metrics: Current cluster metrics.
+            now: Monotonic time of the evaluation cycle; defaults to time.monotonic().
             
         Returns:
             List of scaling decisions.
         """
         decisions = []
+        if now is None:
+            now = time.monotonic()
+        # Bound once per cycle rather than resolved for every container
+        metrics_by_vmid = self.metrics_collector.container_metrics
         
-        for container_config in self.config.containers:
-            if not container_config.enabled:
-                continue
-            
+        for container_config in self.config.enabled_containers:
             decision = await self._evaluate_container_scaling(
-                container_config, cluster_metrics
+                container_config,
+                cluster_metrics,
+                metrics_by_vmid.get(container_config.vmid),
+                now,
             )
             decisions.append(decision)
         
@@ -159,79 +224,66 @@ class ScalingEngine:
     async def _evaluate_container_scaling(
         self, 
         container_config: ContainerConfig,
-        cluster_metrics: ClusterMetrics
+        cluster_metrics: ClusterMetrics,
+        container_metrics: Optional[ContainerMetrics],
+        now: float,
     ) -> ScalingDecision:
         """Evaluate scaling decision for a single container.
         
         Args:
             container_config: Container configuration.
             cluster_metrics: Current cluster metrics.
+            container_metrics: Collected metrics for the container, if any.
+            now: Monotonic time of the evaluation cycle.
             
         Returns:
             Scaling decision.
         """
         vmid = container_config.vmid
         
-        # Get container metrics
-        container_metrics = self.metrics_collector.get_container_metrics(vmid)
+        # An operation still in flight is a hard no-op; answer from its own
+        # decision without looking at the metrics
+        operation = self.active_operations.get(vmid)
+        if operation is not None:
+            in_flight = operation.decision
+            return self._no_action(
+                vmid, in_flight.node, ScalingReason.COOLDOWN_PERIOD,
+                in_flight.current_cpu_cores, in_flight.current_memory_mb,
+            )
         
         if not container_metrics:
-            return ScalingDecision(
-                vmid=vmid,
-                node="unknown",
-                action=ScalingAction.NO_ACTION,
-                reason=ScalingReason.INSUFFICIENT_DATA,
-                current_cpu_cores=0,
-                current_memory_mb=0,
-            )
+            return self._no_action(vmid, "unknown", ScalingReason.INSUFFICIENT_DATA, 0, 0)
         
         # Check if container is running
         if container_metrics.status != 'running':
-            return ScalingDecision(
-                vmid=vmid,
-                node=container_metrics.node,
-                action=ScalingAction.NO_ACTION,
-                reason=ScalingReason.CONTAINER_NOT_RUNNING,
-                current_cpu_cores=0,
-                current_memory_mb=0,
+            return self._no_action(
+                vmid, container_metrics.node, ScalingReason.CONTAINER_NOT_RUNNING, 0, 0
             )
         
-        # Check if there's an active operation for this container
-        if vmid in self.active_operations:
-            return ScalingDecision(
-                vmid=vmid,
-                node=container_metrics.node,
-                action=ScalingAction.NO_ACTION,
-                reason=ScalingReason.COOLDOWN_PERIOD,
-                current_cpu_cores=container_metrics.current_metrics.cpu_cores if container_metrics.current_metrics else 0,
-                current_memory_mb=container_metrics.current_metrics.memory_total_mb if container_metrics.current_metrics else 0,
-            )
+        current = container_metrics.current_metrics
+        current_cpu = current.cpu_cores if current else 0
+        current_memory = current.memory_total_mb if current else 0
         
         # Check cooldown period
-        history = self.scaling_history.get(vmid, ScalingHistory(vmid=vmid))
-        if history.is_in_cooldown(container_config.cooldown_seconds):
-            remaining = history.get_cooldown_remaining(container_config.cooldown_seconds)
-            logger.debug(f"Container {vmid} in cooldown period ({remaining:.0f}s remaining)")
-            return ScalingDecision(
-                vmid=vmid,
-                node=container_metrics.node,
-                action=ScalingAction.NO_ACTION,
-                reason=ScalingReason.COOLDOWN_PERIOD,
-                current_cpu_cores=container_metrics.current_metrics.cpu_cores if container_metrics.current_metrics else 0,
-                current_memory_mb=container_metrics.current_metrics.memory_total_mb if container_metrics.current_metrics else 0,
+        history = self.scaling_history.get(vmid)
+        remaining = (
+            history.get_cooldown_remaining(container_config.cooldown_seconds, now)
+            if history is not None else 0.0
+        )
+        if remaining:
+            logger.debug("Container %d in cooldown period (%.0fs remaining)", vmid, remaining)
+            return self._no_action(
+                vmid, container_metrics.node, ScalingReason.COOLDOWN_PERIOD,
+                current_cpu, current_memory,
             )
         
         # Get evaluation metrics (average over configured periods)
         eval_metrics = container_metrics.get_average_metrics(container_config.evaluation_periods)
         
         if not eval_metrics:
-            return ScalingDecision(
-                vmid=vmid,
-                node=container_metrics.node,
-                action=ScalingAction.NO_ACTION,
-                reason=ScalingReason.INSUFFICIENT_DATA,
-                current_cpu_cores=container_metrics.current_metrics.cpu_cores if container_metrics.current_metrics else 0,
-                current_memory_mb=container_metrics.current_metrics.memory_total_mb if container_metrics.current_metrics else 0,
+            return self._no_action(
+                vmid, container_metrics.node, ScalingReason.INSUFFICIENT_DATA,
+                current_cpu, current_memory,
             )
         
         # Evaluate scaling need
@@ -258,139 +310,106 @@ class ScalingEngine:
             Scaling decision.
         """
         vmid = container_config.vmid
-        thresholds = container_config.thresholds
-        limits = container_config.limits
+        cpu_scale_up, cpu_scale_down, memory_scale_up, memory_scale_down = (
+            container_config.thresholds.as_tuple
+        )
+        (min_cpu_cores, max_cpu_cores, min_memory_mb, max_memory_mb,
+         cpu_step, memory_step_mb) = container_config.limits.as_tuple
         
         current_cpu = eval_metrics.cpu_cores
         current_memory = eval_metrics.memory_total_mb
         cpu_usage = eval_metrics.cpu_usage_percent
         memory_usage = eval_metrics.memory_usage_percent
         
-        # Check for scale-up conditions
-        if cpu_usage >= thresholds.cpu_scale_up:
-            # CPU scale-up needed
-            target_cpu = min(current_cpu + limits.cpu_step, limits.max_cpu_cores)
-            
-            if target_cpu > current_cpu:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.SCALE_UP_CPU,
-                    reason=ScalingReason.CPU_HIGH,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    target_cpu_cores=target_cpu,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-            else:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.NO_ACTION,
-                    reason=ScalingReason.RESOURCE_LIMIT_REACHED,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-        
-        elif memory_usage >= thresholds.memory_scale_up:
-            # Memory scale-up needed
-            target_memory = min(current_memory + limits.memory_step_mb, limits.max_memory_mb)
-            
-            if target_memory > current_memory:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.SCALE_UP_MEMORY,
-                    reason=ScalingReason.MEMORY_HIGH,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    target_memory_mb=target_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-            else:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.NO_ACTION,
-                    reason=ScalingReason.RESOURCE_LIMIT_REACHED,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-        
-        # Check for scale-down conditions
-        elif cpu_usage <= thresholds.cpu_scale_down:
-            # CPU scale-down possible
-            target_cpu = max(current_cpu - limits.cpu_step, limits.min_cpu_cores)
-            
-            if target_cpu < current_cpu:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.SCALE_DOWN_CPU,
-                    reason=ScalingReason.CPU_LOW,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    target_cpu_cores=target_cpu,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-            else:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.NO_ACTION,
-                    reason=ScalingReason.RESOURCE_LIMIT_REACHED,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-        
-        elif memory_usage <= thresholds.memory_scale_down:
-            # Memory scale-down possible
-            target_memory = max(current_memory - limits.memory_step_mb, limits.min_memory_mb)
-            
-            if target_memory < current_memory:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.SCALE_DOWN_MEMORY,
-                    reason=ScalingReason.MEMORY_LOW,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    target_memory_mb=target_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-            else:
-                return ScalingDecision(
-                    vmid=vmid,
-                    node=container_metrics.node,
-                    action=ScalingAction.NO_ACTION,
-                    reason=ScalingReason.RESOURCE_LIMIT_REACHED,
-                    current_cpu_cores=current_cpu,
-                    current_memory_mb=current_memory,
-                    current_cpu_usage=cpu_usage,
-                    current_memory_usage=memory_usage,
-                )
-        
-        # No scaling needed
+        # Pick the action and its target; the first matching condition wins
+        target_cpu: Optional[int] = None
+        target_memory: Optional[int] = None
+        if cpu_usage >= cpu_scale_up:
+            action, reason = ScalingAction.SCALE_UP_CPU, ScalingReason.CPU_HIGH
+            target_cpu = min(current_cpu + cpu_step, max_cpu_cores)
+            within_limits = target_cpu > current_cpu
+        elif memory_usage >= memory_scale_up:
+            action, reason = ScalingAction.SCALE_UP_MEMORY, ScalingReason.MEMORY_HIGH
+            target_memory = min(current_memory + memory_step_mb, max_memory_mb)
+            within_limits = target_memory > current_memory
+        elif cpu_usage <= cpu_scale_down:
+            action, reason = ScalingAction.SCALE_DOWN_CPU, ScalingReason.CPU_LOW
+            target_cpu = max(current_cpu - cpu_step, min_cpu_cores)
+            within_limits = target_cpu < current_cpu
+        elif memory_usage <= memory_scale_down:
+            action, reason = ScalingAction.SCALE_DOWN_MEMORY, ScalingReason.MEMORY_LOW
+            target_memory = max(current_memory - memory_step_mb, min_memory_mb)
+            within_limits = target_memory < current_memory
+        else:
+            # No scaling needed
+            return self._no_action(
+                vmid, container_metrics.node, ScalingReason.NO_ACTION,
+                current_cpu, current_memory, cpu_usage, memory_usage,
+            )
+        
+        if not within_limits:
+            return self._no_action(
+                vmid, container_metrics.node, ScalingReason.RESOURCE_LIMIT_REACHED,
+                current_cpu, current_memory, cpu_usage, memory_usage,
+            )
+        
         return ScalingDecision(
             vmid=vmid,
             node=container_metrics.node,
+            action=action,
+            reason=reason,
+            current_cpu_cores=current_cpu,
+            current_memory_mb=current_memory,
+            target_cpu_cores=target_cpu,
+            target_memory_mb=target_memory,
+            current_cpu_usage=cpu_usage,
+            current_memory_usage=memory_usage,
+        )
+    
+    def _no_action(
+        self,
+        vmid: int,
+        node: str,
+        reason: ScalingReason,
+        current_cpu: int,
+        current_memory: int,
+        cpu_usage: Optional[float] = None,
+        memory_usage: Optional[float] = None,
+    ) -> ScalingDecision:
+        """Get a NO_ACTION decision, reusing the container's previous one if identical.
+        
+        A reused decision keeps the timestamp of the cycle in which the
+        container first reached this state.
+        
+        Args:
+            vmid: Container VMID.
+            node: Node the container runs on.
+            reason: Why no scaling is needed.
+            current_cpu: Current CPU cores.
+            current_memory: Current memory in MB.
+            cpu_usage: Evaluated CPU usage, if known.
+            memory_usage: Evaluated memory usage, if known.
+            
+        Returns:
+            Scaling decision without action.
+        """
+        key = (node, reason, current_cpu, current_memory, cpu_usage, memory_usage)
+        cached = self._no_action_cache.get(vmid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        
+        decision = ScalingDecision(
+            vmid=vmid,
+            node=node,
             action=ScalingAction.NO_ACTION,
-            reason=ScalingReason.NO_ACTION,
+            reason=reason,
             current_cpu_cores=current_cpu,
             current_memory_mb=current_memory,
             current_cpu_usage=cpu_usage,
             current_memory_usage=memory_usage,
         )
+        self._no_action_cache[vmid] = (key, decision)
+        return decision
     
     async def _execute_scaling_decision(self, decision: ScalingDecision) -> bool:
         """Execute a scaling decision.
@@ -406,28 +425,25 @@ class ScalingEngine:
         
         # Check dry-run mode
         if self.config.global_config.dry_run:
-            logger.info(f"DRY RUN: Would execute {decision}")
+            logger.info("DRY RUN: Would execute %s", decision)
             return True
         
         # Create scaling operation
-        operation = ScalingOperation(decision=decision, started_at=time.time())
+        operation = ScalingOperation(decision=decision, started_at=time.monotonic())
         self.active_operations[decision.vmid] = operation
         
         try:
             async with self._operation_semaphore:
-                logger.info(f"Executing scaling operation: {decision}")
+                logger.info("Executing scaling operation: %s", decision)
                 
                 # Perform the scaling
                 await self._perform_scaling(decision)
                 
                 # Mark operation as successful
                 operation.complete_success()
-                logger.info(f"Scaling operation completed successfully: {operation}")
+                logger.info("Scaling operation completed successfully: %s", operation)
                 
-                # Update history
-                history = self.scaling_history.get(decision.vmid, ScalingHistory(vmid=decision.vmid))
-                history.record_operation(operation)
-                self.scaling_history[decision.vmid] = history
+                self._record_operation(operation)
                 
                 return True
                 
@@ -435,12 +451,9 @@ class ScalingEngine:
             # Mark operation as failed
             error_msg = f"Scaling operation failed: {e}"
             operation.complete_failure(error_msg)
-            logger.error(f"Scaling operation failed for container {decision.vmid}: {e}")
+            logger.error("Scaling operation failed for container %d: %s", decision.vmid, e)
             
-            # Update history
-            history = self.scaling_history.get(decision.vmid, ScalingHistory(vmid=decision.vmid))
-            history.record_operation(operation)
-            self.scaling_history[decision.vmid] = history
+            self._record_operation(operation)
             
             return False
             
@@ -449,6 +462,23 @@ class ScalingEngine:
             if decision.vmid in self.active_operations:
                 del self.active_operations[decision.vmid]
     
+    def _record_operation(self, operation: ScalingOperation) -> None:
+        """Record a completed operation in its container's scaling history.
+        
+        Args:
+            operation: Completed scaling operation.
+        """
+        vmid = operation.decision.vmid
+        history = self.scaling_history.get(vmid)
+        if history is None:
+            history = self.scaling_history[vmid] = ScalingHistory(vmid=vmid)
+        history.record_operation(operation)
+        
+        if operation.is_completed:
+            self._total_operations += 1
+            if operation.is_successful:
+                self._total_successes += 1
+    
     async def _perform_scaling(self, decision: ScalingDecision) -> None:
         """Perform the actual scaling operation.
         
@@ -458,14 +488,11 @@ class ScalingEngine:
         Raises:
             ProxmoxAPIError: If scaling operation fails.
         """
-        cpu_cores = decision.target_cpu_cores if decision.target_cpu_cores is not None else decision.current_cpu_cores
-        memory_mb = decision.target_memory_mb if decision.target_memory_mb is not None else decision.current_memory_mb
-        
         await self.client.resize_container(
             node=decision.node,
             vmid=decision.vmid,
-            cpu_cores=cpu_cores,
-            memory_mb=memory_mb,
+            cpu_cores=decision.target_cpu_cores,
+            memory_mb=decision.target_memory_mb,
         )
     
     def get_scaling_status(self) -> Dict[str, any]:
@@ -478,8 +505,8 @@ class ScalingEngine:
         total_containers = len(self.config.containers)
         
         # Calculate success rates
-        total_operations = sum(h.operation_count for h in self.scaling_history.values())
-        total_successes = sum(h.success_count for h in self.scaling_history.values())
+        total_operations = self._total_operations
+        total_successes = self._total_successes
         success_rate = (total_successes / total_operations * 100) if total_operations > 0 else 0
         
         return {
@@ -512,8 +539,8 @@ class ScalingEngine:
             # Check if we can generate decisions (without executing them)
             cluster_metrics = await self.metrics_collector.collect_all_metrics()
             decisions = await self._generate_scaling_decisions(cluster_metrics)
-            logger.debug(f"Health check: Generated {len(decisions)} scaling decisions")
+            logger.debug("Health check: Generated %d scaling decisions", len(decisions))
             return True
         except Exception as e:
-            logger.error(f"Scaling engine health check failed: {e}")
+            logger.error("Scaling engine health check failed: %s", e)
             return False
\ No newline at end of file
@@ -2,14 +2,35 @@
 
 from __future__ import annotations
 
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Optional
 
 
-class ScalingAction(Enum):
-    """Types of scaling actions."""
+# A decision is built per container every cycle; slots need Python 3.10+
+_SCALING_DATACLASS = {}
+if sys.version_info >= (3, 10):
+    _SCALING_DATACLASS['slots'] = True
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum as _StrEnum
+else:
+    class _StrEnum(str, Enum):
+        """Enum whose members are strings and print as their value, like enum.StrEnum."""
+        
+        def __str__(self) -> str:
+            return str.__str__(self)
+
+
+class ScalingAction(_StrEnum):
+    """Types of scaling actions.
+    
+    Members are strings, so equality and hashing use the C-level str
+    implementations, and values serialize and print as-is.
+    """
     SCALE_UP_CPU = "scale_up_cpu"
     SCALE_DOWN_CPU = "scale_down_cpu"
     SCALE_UP_MEMORY = "scale_up_memory"
@@ -17,7 +38,7 @@ class ScalingAction(Enum):
     NO_ACTION = "no_action"
 
 
-class ScalingReason(Enum):
+class ScalingReason(_StrEnum):
     """Reasons for scaling decisions."""
     CPU_HIGH = "cpu_usage_high"
     CPU_LOW = "cpu_usage_low"
@@ -29,9 +50,16 @@ class ScalingReason(Enum):
     CONTAINER_NOT_RUNNING = "container_not_running"
     SAFETY_THRESHOLD_EXCEEDED = "safety_threshold_exceeded"
     DRY_RUN_MODE = "dry_run_mode"
+    NO_ACTION = "within_thresholds"
+
 
+@lru_cache(maxsize=4096)
+def _no_action_str(vmid: int, reason: str) -> str:
+    """Format a NO_ACTION decision, cached as steady-state lines repeat every cycle."""
+    return f"Container {vmid}: No scaling needed ({reason})"
 
-@dataclass
+
+@dataclass(**_SCALING_DATACLASS)
 class ScalingDecision:
     """Represents a scaling decision for a container."""
     
@@ -45,74 +73,70 @@ class ScalingDecision:
     target_memory_mb: Optional[int] = None
     current_cpu_usage: Optional[float] = None
     current_memory_usage: Optional[float] = None
-    timestamp: float = None
+    timestamp: float = field(default_factory=time.time)
+    # Derived once in __post_init__; decisions are not modified afterwards
+    requires_scaling: bool = field(init=False, repr=False, compare=False)
+    cpu_change: int = field(init=False, repr=False, compare=False)
+    memory_change_mb: int = field(init=False, repr=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Set timestamp if not provided."""
-        if self.timestamp is None:
-            self.timestamp = time.time()
-    
-    @property
-    def requires_scaling(self) -> bool:
-        """Check if this decision requires actual scaling."""
-        return self.action != ScalingAction.NO_ACTION
-    
-    @property
-    def cpu_change(self) -> int:
-        """Calculate CPU core change."""
+        """Derive the change fields.
+        
+        A missing target means the resource is left as it is, so it
+        defaults to the current value. requires_scaling tells whether the
+        decision needs actual scaling; cpu_change and memory_change_mb are
+        the core and MB deltas.
+        """
         if self.target_cpu_cores is None:
-            return 0
-        return self.target_cpu_cores - self.current_cpu_cores
-    
-    @property
-    def memory_change_mb(self) -> int:
-        """Calculate memory change in MB."""
+            self.target_cpu_cores = self.current_cpu_cores
         if self.target_memory_mb is None:
-            return 0
-        return self.target_memory_mb - self.current_memory_mb
+            self.target_memory_mb = self.current_memory_mb
+        self.requires_scaling = self.action is not ScalingAction.NO_ACTION
+        self.cpu_change = self.target_cpu_cores - self.current_cpu_cores
+        self.memory_change_mb = self.target_memory_mb - self.current_memory_mb
     
     def __str__(self) -> str:
         """String representation of scaling decision."""
         if not self.requires_scaling:
-            return f"Container {self.vmid}: No scaling needed ({self.reason.value})"
+            return _no_action_str(self.vmid, self.reason)
         
         changes = []
-        if self.cpu_change != 0:
+        if self.cpu_change:
             changes.append(f"CPU: {self.current_cpu_cores} → {self.target_cpu_cores}")
-        if self.memory_change_mb != 0:
+        if self.memory_change_mb:
             changes.append(f"Memory: {self.current_memory_mb} → {self.target_memory_mb}MB")
         
         change_str = ", ".join(changes)
-        return f"Container {self.vmid}: {self.action.value} ({change_str}) - {self.reason.value}"
+        return f"Container {self.vmid}: {self.action} ({change_str}) - {self.reason}"
 
 
-@dataclass
+@dataclass(eq=False, **_SCALING_DATACLASS)
 class ScalingOperation:
-    """Represents an ongoing scaling operation."""
+    """Represents an ongoing scaling operation.
+    
+    Start and completion times are time.monotonic() readings, so durations
+    and cooldowns are unaffected by wall-clock adjustments. Operations are
+    live objects, so equality is identity-based.
+    """
     
     decision: ScalingDecision
-    started_at: float
+    started_at: float = field(default_factory=time.monotonic)
     completed_at: Optional[float] = None
     success: Optional[bool] = None
     error_message: Optional[str] = None
+    # Operation duration in seconds, stored on completion
+    duration: Optional[float] = field(default=None, init=False, compare=False)
     
     def __post_init__(self) -> None:
-        """Set started timestamp if not provided."""
-        if self.started_at is None:
-            self.started_at = time.time()
+        """Derive the duration of an operation built already completed."""
+        if self.completed_at is not None:
+            self.duration = self.completed_at - self.started_at
     
     @property
     def is_completed(self) -> bool:
         """Check if operation is completed."""
         return self.completed_at is not None
     
-    @property
-    def duration(self) -> Optional[float]:
-        """Get operation duration in seconds."""
-        if not self.is_completed:
-            return None
-        return self.completed_at - self.started_at
-    
     @property
     def is_successful(self) -> bool:
         """Check if operation was successful."""
@@ -120,7 +144,8 @@ class ScalingOperation:
     
     def complete_success(self) -> None:
         """Mark operation as successfully completed."""
-        self.completed_at = time.time()
+        self.completed_at = time.monotonic()
+        self.duration = self.completed_at - self.started_at
         self.success = True
     
     def complete_failure(self, error_message: str) -> None:
@@ -129,7 +154,8 @@ class ScalingOperation:
         Args:
             error_message: Error description.
         """
-        self.completed_at = time.time()
+        self.completed_at = time.monotonic()
+        self.duration = self.completed_at - self.started_at
         self.success = False
         self.error_message = error_message
     
@@ -144,9 +170,13 @@ class ScalingOperation:
         return f"Scaling operation for container {self.decision.vmid}: {status}"
 
 
-@dataclass
+@dataclass(eq=False, **_SCALING_DATACLASS)
 class ScalingHistory:
-    """Tracks scaling history for a container."""
+    """Tracks scaling history for a container.
+    
+    last_scaling_time is a time.monotonic() reading taken from the
+    completion of the last operation. Equality is identity-based.
+    """
     
     vmid: int
     last_scaling_time: Optional[float] = None
@@ -154,6 +184,12 @@ class ScalingHistory:
     operation_count: int = 0
     success_count: int = 0
     failure_count: int = 0
+    # Success rate as percentage (0-100), updated as operations are recorded
+    success_rate: float = field(default=0.0, init=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Derive the success rate from the initial counts."""
+        self._update_success_rate()
     
     def record_operation(self, operation: ScalingOperation) -> None:
         """Record a completed scaling operation.
@@ -172,45 +208,41 @@ class ScalingHistory:
             self.success_count += 1
         else:
             self.failure_count += 1
+        self._update_success_rate()
     
-    def is_in_cooldown(self, cooldown_seconds: int) -> bool:
+    def is_in_cooldown(self, cooldown_seconds: int, now: Optional[float] = None) -> bool:
         """Check if container is in cooldown period.
         
         Args:
             cooldown_seconds: Cooldown period in seconds.
+            now: Current time, e.g. sampled once per cycle; defaults to time.monotonic().
             
         Returns:
             True if in cooldown period.
         """
-        if self.last_scaling_time is None:
-            return False
-        
-        time_since_last = time.time() - self.last_scaling_time
-        return time_since_last < cooldown_seconds
+        return self.get_cooldown_remaining(cooldown_seconds, now) > 0
     
-    def get_cooldown_remaining(self, cooldown_seconds: int) -> float:
+    def get_cooldown_remaining(self, cooldown_seconds: int, now: Optional[float] = None) -> float:
         """Get remaining cooldown time in seconds.
         
         Args:
             cooldown_seconds: Cooldown period in seconds.
+            now: Current time, e.g. sampled once per cycle; defaults to time.monotonic().
             
         Returns:
             Remaining cooldown time or 0 if not in cooldown.
         """
-        if not self.is_in_cooldown(cooldown_seconds):
+        if self.last_scaling_time is None:
             return 0.0
         
-        time_since_last = time.time() - self.last_scaling_time
-        return cooldown_seconds - time_since_last
+        if now is None:
+            now = time.monotonic()
+        remaining = cooldown_seconds - (now - self.last_scaling_time)
+        return remaining if remaining > 0 else 0.0
     
-    @property
-    def success_rate(self) -> float:
-        """Calculate success rate of scaling operations.
-        
-        Returns:
-            Success rate as percentage (0-100).
-        """
+    def _update_success_rate(self) -> None:
+        """Recalculate the success rate from the operation counts."""
         if self.operation_count == 0:
-            return 0.0
-        
-        return (self.success_count / self.operation_count) * 100
\ No newline at end of file
+            self.success_rate = 0.0
+        else:
+            self.success_rate = (self.success_count / self.operation_count) * 100
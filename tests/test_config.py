@@ -3,6 +3,7 @@
 import pytest
 import tempfile
 import yaml
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 from lxc_autoscaler.config.manager import ConfigManager, ConfigurationError
@@ -12,6 +13,7 @@ from lxc_autoscaler.config.models import (
     ContainerConfig,
     ResourceLimits,
     ScalingThresholds,
+    diff_containers,
 )
 
 
@@ -41,6 +43,16 @@ class TestConfigModels:
         assert config.token_name == "api-token"
         assert config.token_value == "secret-token-value"
     
+    def test_proxmox_config_negative_cache_ttl_fails(self):
+        """Test ProxmoxConfig rejects a negative cache TTL."""
+        with pytest.raises(ValueError, match="Cache TTL"):
+            ProxmoxConfig(host="192.168.1.100", password="secret123", cache_ttl=-1)
+    
+    def test_proxmox_config_max_concurrent_validation(self):
+        """Test ProxmoxConfig requires at least one concurrent request."""
+        with pytest.raises(ValueError, match="Max concurrent requests"):
+            ProxmoxConfig(host="192.168.1.100", password="secret123", max_concurrent=0)
+    
     def test_proxmox_config_no_auth_fails(self):
         """Test ProxmoxConfig fails without authentication."""
         with pytest.raises(ValueError, match="Either password or token authentication"):
@@ -86,6 +98,102 @@ class TestConfigModels:
         assert config.limits is not None
         assert config.cooldown_seconds == 300
         assert config.evaluation_periods == 3
+    
+    def test_threshold_and_limit_tuples(self):
+        """Test precomputed tuples match the validated field values."""
+        thresholds = ScalingThresholds(cpu_scale_up=90.0, memory_scale_down=20.0)
+        assert thresholds.as_tuple == (90.0, 30.0, 85.0, 20.0)
+        
+        limits = ResourceLimits(max_cpu_cores=4, memory_step_mb=128)
+        assert limits.as_tuple == (1, 4, 512, 8192, 1, 128)
+    
+    def test_config_models_are_immutable(self):
+        """Test validated configuration objects cannot be modified."""
+        config = ContainerConfig(vmid=101)
+        with pytest.raises(FrozenInstanceError):
+            config.enabled = False
+        with pytest.raises(FrozenInstanceError):
+            config.thresholds.cpu_scale_up = 10.0
+    
+    def test_autoscaler_config_container_index(self):
+        """Test container lookups and the enabled list stay in sync with add and remove."""
+        config = AutoscalerConfig(
+            proxmox=ProxmoxConfig(host="192.168.1.100", password="secret123"),
+            containers=[ContainerConfig(vmid=101), ContainerConfig(vmid=102)],
+        )
+        assert config.get_container_config(102).vmid == 102
+        
+        updated = ContainerConfig(vmid=101, enabled=False)
+        config.add_container(updated)
+        config.add_container(ContainerConfig(vmid=103))
+        assert config.get_container_config(101) is updated
+        assert [c.vmid for c in config.containers] == [101, 102, 103]
+        assert [c.vmid for c in config.enabled_containers] == [102, 103]
+        
+        assert config.remove_container(102) is True
+        assert config.remove_container(102) is False
+        assert config.get_container_config(102) is None
+        assert [c.vmid for c in config.containers] == [101, 103]
+        assert [c.vmid for c in config.enabled_containers] == [103]
+    
+    def test_autoscaler_config_duplicate_vmids(self):
+        """Test removing a duplicated VMID falls back to its next entry."""
+        duplicate = ContainerConfig(vmid=101, cooldown_seconds=600)
+        config = AutoscalerConfig(
+            proxmox=ProxmoxConfig(host="192.168.1.100", password="secret123"),
+            containers=[ContainerConfig(vmid=101), duplicate, ContainerConfig(vmid=102)],
+        )
+        
+        assert config.remove_container(101) is True
+        assert config.get_container_config(101) is duplicate
+        assert config.get_container_config(102).vmid == 102
+        
+        updated = ContainerConfig(vmid=101, enabled=False)
+        config.add_container(updated)
+        assert [c.vmid for c in config.containers] == [101, 102]
+        assert config.containers[0] is updated
+        
+        assert config.remove_container(101) is True
+        assert config.remove_container(101) is False
+        assert [c.vmid for c in config.containers] == [102]
+        
+        config.add_container(ContainerConfig(vmid=103))
+        assert config.get_container_config(103) is config.containers[1]
+    
+    def test_diff_containers(self):
+        """Test container changes are detected between two configurations."""
+        unchanged = ContainerConfig(vmid=101)
+        old = {101: unchanged, 102: ContainerConfig(vmid=102), 103: ContainerConfig(vmid=103)}
+        new = {
+            101: ContainerConfig(vmid=101),
+            103: ContainerConfig(vmid=103, cooldown_seconds=600),
+            104: ContainerConfig(vmid=104),
+        }
+        
+        added, removed, updated = diff_containers(old, new)
+        
+        assert [c.vmid for c in added] == [104]
+        assert removed == [102]
+        assert [c.vmid for c in updated] == [103]
+    
+    def test_autoscaler_config_from_dict(self):
+        """Test building AutoscalerConfig from a raw mapping."""
+        config = AutoscalerConfig.from_dict({
+            'proxmox': {'host': '192.168.1.100', 'password': 'secret123'},
+            'default_thresholds': {'cpu_scale_up': 75.0},
+            'containers': [{'vmid': 101, 'limits': {'max_cpu_cores': 8}}],
+        })
+        
+        container = config.containers[0]
+        assert container.thresholds is config.default_thresholds
+        assert container.thresholds.cpu_scale_up == 75.0
+        assert container.limits.max_cpu_cores == 8
+        
+        with pytest.raises(ValueError, match="must include 'vmid'"):
+            AutoscalerConfig.from_dict({
+                'proxmox': {'host': '192.168.1.100', 'password': 'secret123'},
+                'containers': [{'enabled': True}],
+            })
 
 
 class TestConfigManager:
@@ -155,6 +263,110 @@ class TestConfigManager:
             config_file.unlink()
             del os.environ['TEST_PROXMOX_HOST']
     
+    def test_load_config_writes_no_files(self):
+        """Test loading never persists the parsed configuration or its secrets."""
+        import os
+        
+        os.environ['TEST_PROXMOX_PASSWORD'] = 'envSecret123'
+        config_file = self.create_test_config_file({
+            'proxmox': {'host': '192.168.1.100', 'password': '${TEST_PROXMOX_PASSWORD}'}
+        })
+        try:
+            config = ConfigManager(str(config_file)).load_config()
+            
+            assert config.proxmox.password == 'envSecret123'
+            assert list(config_file.parent.glob(f"*{config_file.name}*")) == [config_file]
+        finally:
+            config_file.unlink()
+            del os.environ['TEST_PROXMOX_PASSWORD']
+    
+    def test_substitute_embedded_env_vars(self):
+        """Test environment variables embedded in longer strings."""
+        import os
+        
+        os.environ['TEST_WEBHOOK_HOST'] = 'hooks.example.com'
+        config_file = self.create_test_config_file({
+            'proxmox': {'host': '192.168.1.100', 'password': 'secret123'}
+        })
+        try:
+            manager = ConfigManager(str(config_file))
+            data = manager._substitute_environment_variables({
+                'webhook': 'https://${TEST_WEBHOOK_HOST}/${TEST_WEBHOOK_PATH:notify}',
+                'nested': [{'value': '${TEST_UNSET_VARIABLE}'}],
+                'number': 5,
+            })
+            
+            assert data['webhook'] == 'https://hooks.example.com/notify'
+            assert data['nested'][0]['value'] is None
+            assert data['number'] == 5
+        finally:
+            config_file.unlink()
+            del os.environ['TEST_WEBHOOK_HOST']
+    
+    def test_reload_unchanged_config_returns_cached(self):
+        """Test reloading an unmodified file reuses the loaded configuration."""
+        import os
+        
+        config_data = {
+            'proxmox': {
+                'host': '192.168.1.100',
+                'user': 'root@pam',
+                'password': 'secret123'
+            }
+        }
+        
+        config_file = self.create_test_config_file(config_data)
+        try:
+            manager = ConfigManager(str(config_file))
+            config = manager.load_config()
+            assert manager.reload_config() is config
+            
+            # Touching the file without changing its contents keeps the config
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert manager.reload_config() is config
+            
+            config_data['proxmox']['host'] = '192.168.1.101'
+            with open(config_file, 'w') as f:
+                yaml.safe_dump(config_data, f)
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+            
+            reloaded = manager.reload_config()
+            assert reloaded is not config
+            assert reloaded.proxmox.host == '192.168.1.101'
+        finally:
+            config_file.unlink()
+    
+    def test_container_overrides_merge_with_defaults(self):
+        """Test per-container overrides are merged onto configured defaults."""
+        config_data = {
+            'proxmox': {
+                'host': '192.168.1.100',
+                'password': 'secret123'
+            },
+            'default_thresholds': {'cpu_scale_up': 75.0},
+            'default_limits': {'max_cpu_cores': 4},
+            'containers': [
+                {'vmid': 101},
+                {'vmid': 102, 'thresholds': {'memory_scale_up': 90.0}, 'limits': {'cpu_step': 2}},
+            ]
+        }
+        
+        config_file = self.create_test_config_file(config_data)
+        try:
+            config = ConfigManager(str(config_file)).load_config()
+            plain, custom = config.containers
+            
+            assert plain.thresholds is config.default_thresholds
+            assert plain.limits is config.default_limits
+            assert custom.thresholds.cpu_scale_up == 75.0
+            assert custom.thresholds.memory_scale_up == 90.0
+            assert custom.limits.max_cpu_cores == 4
+            assert custom.limits.cpu_step == 2
+        finally:
+            config_file.unlink()
+    
     def test_load_config_missing_proxmox(self):
         """Test loading configuration without Proxmox section fails."""
         config_data = {
@@ -194,7 +406,3 @@ class TestConfigManager:
             assert result is True
         finally:
             config_file.unlink()
-
-
-if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
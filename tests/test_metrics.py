@@ -2,9 +2,18 @@
 
 import pytest
 import time
+from dataclasses import FrozenInstanceError, replace
 from unittest.mock import AsyncMock, MagicMock
 
+from lxc_autoscaler.api.exceptions import ProxmoxAPIError
+from lxc_autoscaler.config.models import (
+    AutoscalerConfig,
+    ContainerConfig,
+    ProxmoxConfig,
+)
+from lxc_autoscaler.metrics.collector import MetricsCollector
 from lxc_autoscaler.metrics.models import (
+    MAX_HISTORY,
     ResourceMetrics,
     ContainerMetrics,
     NodeMetrics,
@@ -37,6 +46,21 @@ class TestResourceMetrics:
         assert metrics.memory_total_mb == 2048  # 2GB in MB
         assert metrics.cpu_cores == 2
     
+    def test_metrics_are_immutable(self):
+        """Test sampled data points cannot be modified and can be hashed."""
+        metrics = ResourceMetrics(
+            timestamp=1640995200.0,
+            cpu_usage_percent=45.0,
+            memory_usage_percent=50.0,
+            memory_used_mb=1024,
+            memory_total_mb=2048,
+            cpu_cores=2
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            metrics.cpu_usage_percent = 90.0
+        assert {metrics} == {replace(metrics)}
+    
     def test_string_representation(self):
         """Test ResourceMetrics string representation."""
         metrics = ResourceMetrics(
@@ -83,6 +107,33 @@ class TestContainerMetrics:
         assert len(container.historical_metrics) == 1
         assert container.historical_metrics[0] == metrics
     
+    def test_history_is_bounded(self):
+        """Test only the most recent data points are kept."""
+        container = ContainerMetrics(
+            vmid=101,
+            node="proxmox-01",
+            name="test-container",
+            status="running",
+            uptime=3600
+        )
+        
+        for i in range(MAX_HISTORY + 5):
+            container.add_metrics(ResourceMetrics(
+                timestamp=float(i),
+                cpu_usage_percent=float(i % 100),
+                memory_usage_percent=50.0,
+                memory_used_mb=1024,
+                memory_total_mb=2048,
+                cpu_cores=2
+            ))
+        
+        assert len(container.historical_metrics) == MAX_HISTORY
+        assert container.historical_metrics[0].timestamp == 5.0
+        assert container.historical_metrics[-1].timestamp == float(MAX_HISTORY + 4)
+        # Window averages stay correct once old data points are evicted
+        assert container.get_average_metrics(3).cpu_usage_percent == 3.0  # (2 + 3 + 4) / 3
+        assert container.get_average_metrics(MAX_HISTORY).cpu_usage_percent == 49.5
+    
     def test_get_average_metrics(self):
         """Test calculating average metrics."""
         container = ContainerMetrics(
@@ -233,6 +284,7 @@ class TestClusterMetrics:
         
         assert availability['cpu_available_percent'] == 60.0  # 100 - 40
         assert availability['memory_available_percent'] == 50.0  # 100 - 50
+        assert cluster.get_resource_availability() is availability
     
     def test_empty_cluster_metrics(self):
         """Test cluster metrics with no nodes."""
@@ -253,5 +305,111 @@ class TestClusterMetrics:
         assert availability['memory_available_percent'] == 0.0
 
 
-if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
+class TestMetricsCollector:
+    """Test MetricsCollector against a mocked Proxmox client."""
+    
+    def create_collector(self, vmids):
+        """Create a collector with a mocked client for the given containers."""
+        config = AutoscalerConfig(
+            proxmox=ProxmoxConfig(host="192.168.1.100", password="secret123"),
+            containers=[ContainerConfig(vmid=vmid) for vmid in vmids],
+        )
+        client = MagicMock()
+        client.get_cluster_vm_resources = AsyncMock(return_value={
+            101: {'vmid': 101, 'type': 'lxc', 'node': 'proxmox-01',
+                  'status': 'running', 'uptime': 3600, 'name': 'web',
+                  'maxcpu': 1.5},
+            102: {'vmid': 102, 'type': 'lxc', 'node': 'proxmox-02',
+                  'status': 'stopped', 'uptime': 0, 'name': 'db',
+                  'maxcpu': 4},
+        })
+        client.get_container_config = AsyncMock(
+            return_value={'cores': 4, 'cpulimit': 1.5, 'hostname': 'web'}
+        )
+        client.get_container_rrd_data = AsyncMock(return_value=[
+            {'time': 1640995200.0, 'cpu': 0.5, 'mem': 1073741824, 'maxmem': 2147483648},
+        ])
+        client.find_container_node = AsyncMock()
+        client.get_container_status = AsyncMock()
+        return MetricsCollector(client, config), client
+    
+    async def test_container_metrics_use_cluster_resources(self):
+        """Test running containers get config and RRD data besides one cluster request."""
+        collector, client = self.create_collector([101, 102, 103])
+        
+        await collector._collect_container_metrics()
+        
+        client.get_cluster_vm_resources.assert_awaited_once()
+        client.find_container_node.assert_not_awaited()
+        client.get_container_status.assert_not_awaited()
+        client.get_container_config.assert_awaited_once_with('proxmox-01', 101)
+        client.get_container_rrd_data.assert_awaited_once()
+        
+        metrics = collector.get_container_metrics(101)
+        assert metrics.node == 'proxmox-01'
+        assert metrics.name == 'web'
+        assert metrics.current_metrics.cpu_usage_percent == 50.0
+        # Configured cores, not the cpulimit-capped maxcpu of the snapshot
+        assert metrics.current_metrics.cpu_cores == 4
+        assert collector.get_container_metrics(102) is None
+        assert collector.get_container_metrics(103) is None
+    
+    async def test_reload_refreshes_enabled_containers(self):
+        """Test containers disabled by a reload are no longer collected."""
+        collector, client = self.create_collector([101])
+        new_config = AutoscalerConfig(
+            proxmox=collector.config.proxmox,
+            containers=[ContainerConfig(vmid=101, enabled=False)],
+        )
+        
+        collector.apply_container_diff(new_config, [], [], new_config.containers)
+        await collector._collect_container_metrics()
+        
+        client.get_cluster_vm_resources.assert_not_awaited()
+        client.get_container_rrd_data.assert_not_awaited()
+    
+    async def test_node_metrics_replaced_each_cycle(self):
+        """Test node metrics only keep nodes that reported in the last cycle."""
+        collector, client = self.create_collector([])
+        collector.node_metrics['old-node'] = MagicMock()
+        client.list_nodes = AsyncMock(return_value=[
+            {'node': 'proxmox-01', 'status': 'online'},
+            {'node': 'proxmox-02', 'status': 'online'},
+            {'node': 'proxmox-03', 'status': 'offline'},
+        ])
+        
+        async def get_node_status(node):
+            if node == 'proxmox-02':
+                raise ProxmoxAPIError("node unreachable")
+            return {'cpu': 0.25, 'memory': {'used': 4294967296, 'total': 8589934592},
+                    'uptime': 86400, 'loadavg': ['0.5', '0.4', '0.3']}
+        
+        client.get_node_status = AsyncMock(side_effect=get_node_status)
+        
+        await collector._collect_node_metrics()
+        
+        assert list(collector.node_metrics) == ['proxmox-01']
+        assert collector.node_metrics['proxmox-01'].cpu_usage_percent == 25.0
+    
+    def test_build_cluster_metrics(self):
+        """Test cluster totals and averages over collected node metrics."""
+        collector, _ = self.create_collector([])
+        for name, cpu, memory, load in (("node1", 50.0, 60.0, [1.0, 1.0, 1.0]),
+                                        ("node2", 30.0, 40.0, [])):
+            collector.node_metrics[name] = NodeMetrics(
+                node_name=name,
+                cpu_usage_percent=cpu,
+                memory_usage_percent=memory,
+                memory_used_gb=5.0,
+                memory_total_gb=10.0,
+                uptime=86400,
+                load_average=load,
+            )
+        
+        cluster = collector._build_cluster_metrics()
+        
+        assert cluster.total_cpu_cores == 4
+        assert cluster.total_memory_gb == 20.0
+        assert cluster.avg_cpu_usage_percent == 40.0
+        assert cluster.avg_memory_usage_percent == 50.0
+        assert cluster.running_containers == 0
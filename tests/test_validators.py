@@ -1,5 +1,7 @@
 """Tests for validation utilities."""
 
+import re
+
 import pytest
 
 from lxc_autoscaler.core.exceptions import ValidationError
@@ -14,26 +16,40 @@ from lxc_autoscaler.core.validators import (
     PortValidator,
     PercentageValidator,
     VMIDValidator,
+    compile_object_validator,
     validate_field,
     validate_object,
 )
 
 
+# Validators are stateless, so shared instances are built once per module
+_REQUIRED = RequiredValidator("test_field")
+_STRING = TypeValidator("test_field", str)
+_PERCENT_RANGE = RangeValidator("test_field", 0, 100)
+_FRUIT = ChoiceValidator("test_field", ["apple", "banana", "cherry"])
+_LOWERCASE_RE = re.compile(r"^[a-z]+$")
+_LOWERCASE = RegexValidator("test_field", _LOWERCASE_RE)
+_SHORT_LENGTH = LengthValidator("test_field", 2, 5)
+_REQUIRED_SHORT_STRING = [
+    _REQUIRED,
+    _STRING,
+    LengthValidator("test_field", 3, 10),
+]
+
+
 class TestRequiredValidator:
     """Test RequiredValidator."""
     
     def test_valid_value(self):
         """Test required validator with valid value."""
-        validator = RequiredValidator("test_field")
-        assert validator.validate("some_value") == "some_value"
-        assert validator.validate(0) == 0
-        assert validator.validate(False) is False
+        assert _REQUIRED.validate("some_value") == "some_value"
+        assert _REQUIRED.validate(0) == 0
+        assert _REQUIRED.validate(False) is False
     
     def test_none_value_fails(self):
         """Test required validator fails on None."""
-        validator = RequiredValidator("test_field")
         with pytest.raises(ValidationError, match="test_field is required"):
-            validator.validate(None)
+            _REQUIRED.validate(None)
 
 
 class TestTypeValidator:
@@ -41,17 +57,13 @@ class TestTypeValidator:
     
     def test_valid_type(self):
         """Test type validator with valid type."""
-        validator = TypeValidator("test_field", str)
-        assert validator.validate("hello") == "hello"
-        
-        validator = TypeValidator("test_field", int)
-        assert validator.validate(42) == 42
+        assert _STRING.validate("hello") == "hello"
+        assert TypeValidator("test_field", int).validate(42) == 42
     
     def test_invalid_type_fails(self):
         """Test type validator fails on wrong type."""
-        validator = TypeValidator("test_field", str)
         with pytest.raises(ValidationError, match="test_field must be of type str"):
-            validator.validate(42)
+            _STRING.validate(42)
 
 
 class TestRangeValidator:
@@ -59,10 +71,9 @@ class TestRangeValidator:
     
     def test_valid_range(self):
         """Test range validator with valid values."""
-        validator = RangeValidator("test_field", 0, 100)
-        assert validator.validate(50) == 50
-        assert validator.validate(0) == 0
-        assert validator.validate(100) == 100
+        assert _PERCENT_RANGE.validate(50) == 50
+        assert _PERCENT_RANGE.validate(0) == 0
+        assert _PERCENT_RANGE.validate(100) == 100
     
     def test_value_too_low_fails(self):
         """Test range validator fails on too low value."""
@@ -72,15 +83,13 @@ class TestRangeValidator:
     
     def test_value_too_high_fails(self):
         """Test range validator fails on too high value."""
-        validator = RangeValidator("test_field", 0, 100)
         with pytest.raises(ValidationError, match="test_field must be <= 100"):
-            validator.validate(150)
+            _PERCENT_RANGE.validate(150)
     
     def test_non_numeric_fails(self):
         """Test range validator fails on non-numeric value."""
-        validator = RangeValidator("test_field", 0, 100)
         with pytest.raises(ValidationError, match="test_field must be numeric"):
-            validator.validate("not_a_number")
+            _PERCENT_RANGE.validate("not_a_number")
 
 
 class TestChoiceValidator:
@@ -88,14 +97,12 @@ class TestChoiceValidator:
     
     def test_valid_choice(self):
         """Test choice validator with valid choice."""
-        validator = ChoiceValidator("test_field", ["apple", "banana", "cherry"])
-        assert validator.validate("banana") == "banana"
+        assert _FRUIT.validate("banana") == "banana"
     
     def test_invalid_choice_fails(self):
         """Test choice validator fails on invalid choice."""
-        validator = ChoiceValidator("test_field", ["apple", "banana", "cherry"])
         with pytest.raises(ValidationError, match="test_field must be one of"):
-            validator.validate("grape")
+            _FRUIT.validate("grape")
 
 
 class TestRegexValidator:
@@ -103,20 +110,29 @@ class TestRegexValidator:
     
     def test_valid_pattern(self):
         """Test regex validator with matching pattern."""
-        validator = RegexValidator("test_field", r"^[a-z]+$")
-        assert validator.validate("hello") == "hello"
+        assert _LOWERCASE.validate("hello") == "hello"
     
     def test_invalid_pattern_fails(self):
         """Test regex validator fails on non-matching pattern."""
-        validator = RegexValidator("test_field", r"^[a-z]+$")
         with pytest.raises(ValidationError, match="test_field does not match required format"):
-            validator.validate("Hello123")
+            _LOWERCASE.validate("Hello123")
     
     def test_non_string_fails(self):
         """Test regex validator fails on non-string."""
-        validator = RegexValidator("test_field", r"^[a-z]+$")
         with pytest.raises(ValidationError, match="test_field must be a string"):
-            validator.validate(123)
+            _LOWERCASE.validate(123)
+    
+    def test_identical_patterns_share_compiled_regex(self):
+        """Test validators with the same pattern reuse one compiled regex."""
+        first = RegexValidator("a", r"^[a-z]+$")
+        second = RegexValidator("b", r"^[a-z]+$")
+        assert first.pattern is second.pattern
+        assert HostnameValidator("x").pattern is HostnameValidator("y").pattern
+    
+    def test_compiled_pattern_used_as_is(self):
+        """Test a precompiled pattern is used without recompiling."""
+        assert _LOWERCASE.pattern is _LOWERCASE_RE
+        assert RegexValidator("other", _LOWERCASE_RE).pattern is _LOWERCASE_RE
 
 
 class TestLengthValidator:
@@ -136,9 +152,13 @@ class TestLengthValidator:
     
     def test_too_long_fails(self):
         """Test length validator fails on too long value."""
-        validator = LengthValidator("test_field", 2, 5)
         with pytest.raises(ValidationError, match="test_field must have at most 5 characters"):
-            validator.validate("this is too long")
+            _SHORT_LENGTH.validate("this is too long")
+    
+    def test_value_without_length_fails(self):
+        """Test length validator fails on a value without a length."""
+        with pytest.raises(ValidationError, match="test_field must have a length"):
+            _SHORT_LENGTH.validate(42)
 
 
 class TestSpecializedValidators:
@@ -153,6 +173,8 @@ class TestSpecializedValidators:
         assert validator.validate("sub.example.com") == "sub.example.com"
         assert validator.validate("localhost") == "localhost"
         assert validator.validate("server-01") == "server-01"
+        assert validator.pattern.fullmatch("server-01")
+        assert not validator.pattern.fullmatch("example.com")
         
         # Invalid hostnames
         with pytest.raises(ValidationError):
@@ -161,6 +183,17 @@ class TestSpecializedValidators:
             validator.validate("-invalid")
         with pytest.raises(ValidationError):
             validator.validate("invalid-")
+        with pytest.raises(ValidationError):
+            validator.validate("example.com\n")
+        with pytest.raises(ValidationError):
+            validator.validate(".".join(["a" * 63] * 4))
+    
+    def test_field_name_only_validators_are_shared(self):
+        """Test validators configured by field name alone are built once per field."""
+        for cls in (HostnameValidator, PortValidator, PercentageValidator, VMIDValidator):
+            assert cls("field") is cls("field")
+            assert cls("field") is not cls("other")
+        assert PortValidator("field") is not VMIDValidator("field")
     
     def test_port_validator(self):
         """Test port validator."""
@@ -213,11 +246,7 @@ class TestValidationHelpers:
     
     def test_validate_field_multiple_validators(self):
         """Test validating field with multiple validators."""
-        validators = [
-            RequiredValidator("test_field"),
-            TypeValidator("test_field", str),
-            LengthValidator("test_field", 3, 10)
-        ]
+        validators = _REQUIRED_SHORT_STRING
         
         # Valid value
         result = validate_field("hello", validators)
@@ -235,6 +264,27 @@ class TestValidationHelpers:
         with pytest.raises(ValidationError):
             validate_field("hi", validators)
     
+    def test_validate_field_accepts_tuple(self):
+        """Test validating a field with a frozen tuple of validators."""
+        validators = tuple(_REQUIRED_SHORT_STRING)
+        
+        assert validate_field("hello", validators) == "hello"
+        with pytest.raises(ValidationError, match="test_field must have at least 3 characters"):
+            validate_field("hi", validators)
+    
+    def test_validate_field_stops_at_first_failure(self):
+        """Test validators after a failing one are never consumed."""
+        consumed = []
+        
+        def validators():
+            for validator in (RequiredValidator("f"), TypeValidator("f", str)):
+                consumed.append(validator)
+                yield validator
+        
+        with pytest.raises(ValidationError, match="f is required"):
+            validate_field(None, validators())
+        assert len(consumed) == 1
+    
     def test_validate_object(self):
         """Test validating object with field validators."""
         field_validators = {
@@ -263,7 +313,36 @@ class TestValidationHelpers:
         # Invalid object (invalid port)
         with pytest.raises(ValidationError):
             validate_object({"name": "test", "port": 99999}, field_validators)
-
-
-if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
+    
+    def test_compile_object_validator(self):
+        """Test a compiled object validator behaves like validate_object."""
+        validate = compile_object_validator({
+            "name": [RequiredValidator("name"), LengthValidator("name", 1, 50)],
+            "port": (RequiredValidator("port"), PortValidator("port")),
+        })
+        
+        assert validate({"name": "test-server", "port": 8080}) == {
+            "name": "test-server", "port": 8080
+        }
+        with pytest.raises(ValidationError, match="port is required"):
+            validate({"name": "test"})
+        with pytest.raises(ValidationError, match="port must be <= 65535"):
+            validate({"name": "test", "port": 70000})
+    
+    def test_compiled_validator_matches_validate_object(self):
+        """Test compiled and generic object validation agree on results and errors."""
+        field_validators = {
+            "name": [_REQUIRED, _STRING, LengthValidator("name", 1, 50)],
+            "port": [RequiredValidator("port"), PortValidator("port")],
+        }
+        validate = compile_object_validator(field_validators)
+        
+        obj = {"name": "test-server", "port": 8080, "extra": True}
+        assert validate(obj) == validate_object(obj, field_validators)
+        
+        for invalid in ({"name": "test"}, {"name": 42, "port": 80}, {"name": "x", "port": 0}):
+            with pytest.raises(ValidationError) as compiled_error:
+                validate(invalid)
+            with pytest.raises(ValidationError) as generic_error:
+                validate_object(invalid, field_validators)
+            assert str(compiled_error.value) == str(generic_error.value)